@@ -9,6 +9,22 @@ from colormath import color_constants
 logger = logging.getLogger(__name__)
 
 
+# Adaptation matrices calculated so far, keyed by the arguments of
+# _get_adaptation_matrix(). Only adaptations between named illuminants are
+# cached, so this can't grow beyond the number of known illuminant pairs.
+_ADAPTATION_MATRIX_CACHE = {}
+
+
+def _is_illuminant_name(wp, observer):
+    """
+    Checks whether a white point is given as the name of one of the
+    illuminants in color_constants.ILLUMINANTS for the given observer.
+    """
+    if not isinstance(wp, str):
+        return False
+    return wp.lower() in color_constants.ILLUMINANTS.get(observer, ())
+
+
 # noinspection PyPep8Naming
 def _get_adaptation_matrix(wp_src, wp_dst, observer, adaptation):
     """
@@ -21,6 +37,29 @@ def _get_adaptation_matrix(wp_src, wp_dst, observer, adaptation):
     Detailed conversion documentation is available at:
     http://brucelindbloom.com/Eqn_ChromAdapt.html
     """
+    if not (
+        _is_illuminant_name(wp_src, observer) and _is_illuminant_name(wp_dst, observer)
+    ):
+        # White points given as tuples or arrays are often measured per
+        # sample, caching those would keep every one of them around.
+        return _calc_adaptation_matrix(wp_src, wp_dst, observer, adaptation)
+
+    cache_key = (wp_src.lower(), wp_dst.lower(), observer, adaptation)
+    m_xfm = _ADAPTATION_MATRIX_CACHE.get(cache_key)
+    if m_xfm is None:
+        m_xfm = _calc_adaptation_matrix(wp_src, wp_dst, observer, adaptation)
+        # The same matrix is handed out to every caller.
+        m_xfm.flags.writeable = False
+        _ADAPTATION_MATRIX_CACHE[cache_key] = m_xfm
+    return m_xfm
+
+
+# noinspection PyPep8Naming
+def _calc_adaptation_matrix(wp_src, wp_dst, observer, adaptation):
+    """
+    Does the actual work for :py:func:`_get_adaptation_matrix`, without
+    caching.
+    """
     # Get the appropriate transformation matrix, [MsubA].
     m_sharp = color_constants.ADAPTATION_MATRICES[adaptation]
 
@@ -71,22 +110,13 @@ def apply_chromatic_adaptation(
     # function directly, so we'll protect them from messing up upper/lower case.
     adaptation = adaptation.lower()
 
-    # Get white-points for illuminant
-    if isinstance(orig_illum, str):
-        orig_illum = orig_illum.lower()
-        wp_src = color_constants.ILLUMINANTS[observer][orig_illum]
-    elif hasattr(orig_illum, "__iter__"):
-        wp_src = orig_illum
-
-    if isinstance(targ_illum, str):
-        targ_illum = targ_illum.lower()
-        wp_dst = color_constants.ILLUMINANTS[observer][targ_illum]
-    elif hasattr(targ_illum, "__iter__"):
-        wp_dst = targ_illum
-
     logger.debug("  \\* Applying adaptation matrix: %s", adaptation)
-    # Retrieve the appropriate transformation matrix from the constants.
-    transform_matrix = _get_adaptation_matrix(wp_src, wp_dst, observer, adaptation)
+    # Retrieve the appropriate transformation matrix from the constants. Pass
+    # on illuminant names rather than their white points, only adaptations
+    # between named illuminants are cached.
+    transform_matrix = _get_adaptation_matrix(
+        orig_illum, targ_illum, observer, adaptation
+    )
 
     # Stuff the XYZ values into a NumPy matrix for conversion.
     XYZ_matrix = numpy.array((val_x, val_y, val_z))
@@ -97,6 +127,29 @@ def apply_chromatic_adaptation(
     return result_matrix[0], result_matrix[1], result_matrix[2]
 
 
+# noinspection PyPep8Naming
+def apply_chromatic_adaptation_on_array(
+    xyz_array, orig_illum, targ_illum, observer="2", adaptation="bradford"
+):
+    """
+    Applies a chromatic adaptation matrix to many XYZ colors at once. This is
+    the vectorized version of :py:func:`apply_chromatic_adaptation`.
+
+    :param numpy.ndarray xyz_array: (n, 3) array with one XYZ color per row.
+    :returns: (n, 3) array with the adapted XYZ colors.
+    """
+    adaptation = adaptation.lower()
+
+    logger.debug("  \\* Applying adaptation matrix: %s", adaptation)
+    # Retrieve the appropriate transformation matrix from the constants.
+    transform_matrix = _get_adaptation_matrix(
+        orig_illum, targ_illum, observer, adaptation
+    )
+
+    # Every row is one color, so multiply with the transposed matrix.
+    return numpy.dot(xyz_array, transform_matrix.T)
+
+
 # noinspection PyPep8Naming
 def apply_chromatic_adaptation_on_color(color, targ_illum, adaptation="bradford"):
     """
@@ -0,0 +1,501 @@
+# -*- coding: utf-8 -*-
+"""
+Color arrays hold many colors of the same color space in a single (n, 3)
+NumPy array ((n, 4) for CMYK), one color per row. Converting a color array
+runs every step of the conversion on the whole array at once, which is a lot
+faster than converting n individual Color objects.
+"""
+
+import logging
+
+import numpy
+
+from colormath import color_constants
+from colormath.chromatic_adaptation import apply_chromatic_adaptation_on_array
+from colormath.color_conversions import GraphConversionManager, _get_xyz_to_rgb_matrix
+from colormath.color_objects import (
+    ColorBase,
+    IlluminantMixin,
+    LabColor,
+    XYZColor,
+    BaseRGBColor,
+    sRGBColor,
+    BT2020Color,
+    CMYColor,
+    CMYKColor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ColorArrayBase(object):
+    """
+    A base class holding some common methods and values.
+    """
+
+    __slots__ = ("data",)
+
+    #: The Color class a single row of this array corresponds to.
+    color_type = ColorBase
+
+    def __init__(self, data):
+        """
+        :param data: (n, 3) array with one color per row, or (n, 4) for
+            CMYK. The columns are in the order of the ``VALUES`` of
+            :py:attr:`color_type`.
+        """
+        data = numpy.asarray(data, dtype=numpy.float64)
+        if data.ndim != 2 or data.shape[1] != len(self.color_type.VALUES):
+            raise ValueError(
+                "%s data must be of shape (n, %d)."
+                % (self.__class__.__name__, len(self.color_type.VALUES))
+            )
+        #: The array holding the color coordinates.
+        self.data = data
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __repr__(self):
+        return "%s(%d colors)" % (self.__class__.__name__, len(self))
+
+
+class LabColorArray(IlluminantMixin, ColorArrayBase):
+    """
+    Represents an array of CIE Lab colors.
+    """
+
+    __slots__ = ("observer", "illuminant")
+
+    color_type = LabColor
+
+    def __init__(self, data, observer="2", illuminant="d50"):
+        """
+        :param data: (n, 3) array of lab_l, lab_a, lab_b coordinates.
+        :keyword str observer: Observer angle. Either ``'2'`` or ``'10'`` degrees.
+        :keyword str illuminant: See :doc:`illuminants` for valid values.
+        """
+        super(LabColorArray, self).__init__(data)
+        self.observer = None
+        self.illuminant = None
+
+        self.set_observer(observer)
+        self.set_illuminant(illuminant)
+
+
+class XYZColorArray(IlluminantMixin, ColorArrayBase):
+    """
+    Represents an array of XYZ colors.
+    """
+
+    __slots__ = ("observer", "illuminant")
+
+    color_type = XYZColor
+
+    def __init__(self, data, observer="2", illuminant="d50"):
+        """
+        :param data: (n, 3) array of xyz_x, xyz_y, xyz_z coordinates.
+        :keyword str observer: Observer angle. Either ``'2'`` or ``'10'`` degrees.
+        :keyword str illuminant: See :doc:`illuminants` for valid values.
+        """
+        super(XYZColorArray, self).__init__(data)
+        self.observer = None
+        self.illuminant = None
+
+        self.set_observer(observer)
+        self.set_illuminant(illuminant)
+
+    def apply_adaptation(self, target_illuminant, adaptation="bradford"):
+        """
+        This applies an adaptation matrix to change the illuminant of all
+        colors in the array. See
+        :py:meth:`XYZColor.apply_adaptation \
+<colormath.color_objects.XYZColor.apply_adaptation>`.
+        """
+        if target_illuminant != self.illuminant:
+            target_illuminant = target_illuminant.lower()
+
+        if self.illuminant != target_illuminant:
+            self.data = apply_chromatic_adaptation_on_array(
+                self.data,
+                self.illuminant,
+                target_illuminant,
+                observer=self.observer,
+                adaptation=adaptation,
+            )
+            self.set_illuminant(target_illuminant)
+
+
+class RGBColorArray(ColorArrayBase):
+    """
+    Represents an array of RGB colors. Coordinates are between 0.0 and 1.0.
+    """
+
+    __slots__ = ("rgb_type",)
+
+    def __init__(self, data, rgb_type=sRGBColor):
+        """
+        :param data: (n, 3) array of rgb_r, rgb_g, rgb_b coordinates.
+        :keyword rgb_type: The RGB color space of the colors, for example
+            :py:class:`sRGBColor <colormath.color_objects.sRGBColor>`.
+        """
+        #: The RGB color space of the colors.
+        self.rgb_type = rgb_type
+        super(RGBColorArray, self).__init__(data)
+
+    @property
+    def color_type(self):
+        return self.rgb_type
+
+
+class CMYColorArray(ColorArrayBase):
+    """
+    Represents an array of CMY colors. Coordinates are between 0.0 and 1.0.
+    """
+
+    __slots__ = ()
+
+    color_type = CMYColor
+
+    def __init__(self, data):
+        """
+        :param data: (n, 3) array of cmy_c, cmy_m, cmy_y coordinates.
+        """
+        super(CMYColorArray, self).__init__(data)
+
+
+class CMYKColorArray(ColorArrayBase):
+    """
+    Represents an array of CMYK colors. Coordinates are between 0.0 and 1.0.
+    """
+
+    __slots__ = ()
+
+    color_type = CMYKColor
+
+    def __init__(self, data):
+        """
+        :param data: (n, 4) array of cmyk_c, cmyk_m, cmyk_y, cmyk_k
+            coordinates.
+        """
+        super(CMYKColorArray, self).__init__(data)
+
+
+_conversion_manager = GraphConversionManager()
+
+
+def color_array_conversion_function(start_type, target_type):
+    """
+    Decorator to indicate a function that converts a color array from one
+    color space to another. See
+    :py:func:`colormath.color_conversions.color_conversion_function`, the
+    color spaces are given as Color classes as well.
+
+    :param start_type: Starting color space type
+    :param target_type: Target color space type
+    """
+
+    def decorator(f):
+        f.start_type = start_type
+        f.target_type = target_type
+        _conversion_manager.add_type_conversion(start_type, target_type, f)
+        return f
+
+    return decorator
+
+
+# Reference white points as arrays, keyed by (observer, illuminant).
+_WHITE_POINT_CACHE = {}
+
+
+def _get_white_point(carray):
+    """
+    Returns the (X, Y, Z) reference white of the color array's observer and
+    illuminant as a NumPy array, so it doesn't have to be converted from a
+    tuple for every array.
+
+    :rtype: numpy.ndarray
+    """
+    cache_key = (carray.observer, carray.illuminant)
+    white_point = _WHITE_POINT_CACHE.get(cache_key)
+    if white_point is None:
+        white_point = numpy.array(carray._get_illuminant_xyz_tuple())
+        white_point.flags.writeable = False
+        _WHITE_POINT_CACHE[cache_key] = white_point
+    return white_point
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(LabColor, XYZColor)
+def Lab_to_XYZ(carray, *args, **kwargs):
+    """
+    Convert from Lab to XYZ.
+    """
+    illum = _get_white_point(carray)
+    lab = carray.data
+    xyz_y = (lab[:, 0] + 16.0) / 116.0
+    xyz_x = lab[:, 1] / 500.0 + xyz_y
+    xyz_z = xyz_y - lab[:, 2] / 200.0
+
+    xyz = numpy.column_stack((xyz_x, xyz_y, xyz_z))
+    cubed = numpy.power(xyz, 3)
+    xyz = numpy.where(
+        cubed > color_constants.CIE_E, cubed, (xyz - 16.0 / 116.0) / 7.787
+    )
+    xyz *= illum
+
+    return XYZColorArray(xyz, observer=carray.observer, illuminant=carray.illuminant)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(XYZColor, LabColor)
+def XYZ_to_Lab(carray, *args, **kwargs):
+    """
+    Converts XYZ to Lab.
+    """
+    illum = _get_white_point(carray)
+    temp = carray.data / illum
+
+    # numpy.cbrt is a lot cheaper than the generic numpy.power(temp, 1.0 / 3.0).
+    temp_f = numpy.where(
+        temp > color_constants.CIE_E,
+        numpy.cbrt(temp),
+        (7.787 * temp) + (16.0 / 116.0),
+    )
+
+    lab = numpy.empty_like(temp_f)
+    lab[:, 0] = (116.0 * temp_f[:, 1]) - 16.0
+    lab[:, 1] = 500.0 * (temp_f[:, 0] - temp_f[:, 1])
+    lab[:, 2] = 200.0 * (temp_f[:, 1] - temp_f[:, 2])
+
+    return LabColorArray(lab, observer=carray.observer, illuminant=carray.illuminant)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(XYZColor, BaseRGBColor)
+def XYZ_to_RGB(carray, target_rgb, *args, **kwargs):
+    """
+    XYZ to RGB conversion.
+    """
+    if carray.illuminant != target_rgb.native_illuminant:
+        logger.debug(
+            "  \\* Applying transformation from %s to %s ",
+            carray.illuminant,
+            target_rgb.native_illuminant,
+        )
+
+    # Apply the RGB working space matrix and clamp to a valid range. The
+    # matrix is shared with colormath.color_conversions.XYZ_to_RGB and
+    # includes the adaptation to the RGB space's native illuminant if needed,
+    # so this is a single matrix product.
+    rgb_matrix = _get_xyz_to_rgb_matrix(target_rgb, carray.illuminant)
+    linear = numpy.dot(carray.data, rgb_matrix.T)
+    numpy.maximum(linear, 0.0, out=linear)
+
+    if target_rgb == sRGBColor:
+        rgb = linear * 12.92
+        above = linear > 0.0031308
+        rgb[above] = 1.055 * numpy.power(linear[above], 1 / 2.4) - 0.055
+    elif target_rgb == BT2020Color:
+        if kwargs.get("is_12_bits_system"):
+            a, b = 1.0993, 0.0181
+        else:
+            a, b = 1.099, 0.018
+        rgb = linear * 4.5
+        above = linear >= b
+        rgb[above] = a * numpy.power(linear[above], 0.45) - (a - 1)
+    else:
+        rgb = numpy.power(linear, 1 / target_rgb.rgb_gamma)
+
+    return RGBColorArray(rgb, rgb_type=target_rgb)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(BaseRGBColor, XYZColor)
+def RGB_to_XYZ(carray, target_illuminant=None, *args, **kwargs):
+    """
+    RGB to XYZ conversion.
+    """
+    rgb = carray.data
+    rgb_type = carray.rgb_type
+
+    # Linearize the RGB channels (remove the gamma function).
+    if issubclass(rgb_type, sRGBColor):
+        linear = rgb / 12.92
+        above = rgb > 0.04045
+        linear[above] = numpy.power((rgb[above] + 0.055) / 1.055, 2.4)
+    elif issubclass(rgb_type, BT2020Color):
+        if kwargs.get("is_12_bits_system"):
+            a, c = 1.0993, 0.081697877417347
+        else:
+            a, c = 1.099, 0.08124794403514049
+        linear = rgb / 4.5
+        above = rgb > c
+        linear[above] = numpy.power((rgb[above] + (a - 1)) / a, 1 / 0.45)
+    else:
+        linear = numpy.power(rgb, rgb_type.rgb_gamma)
+
+    # Apply the RGB working space matrix and clamp to a valid range.
+    rgb_matrix = rgb_type.conversion_matrices["rgb_to_xyz"]
+    xyz = numpy.dot(linear, rgb_matrix.T)
+    numpy.maximum(xyz, 0.0, out=xyz)
+
+    # The illuminant of the original RGB colors. This will always match the
+    # RGB colorspace's native illuminant.
+    illuminant = rgb_type.native_illuminant
+    if target_illuminant is None:
+        target_illuminant = illuminant
+    target_illuminant = target_illuminant.lower()
+
+    if illuminant != target_illuminant:
+        logger.debug(
+            "  \\* Applying transformation from %s to %s ",
+            illuminant,
+            target_illuminant,
+        )
+        xyz = apply_chromatic_adaptation_on_array(
+            xyz, illuminant, target_illuminant, observer="2"
+        )
+
+    return XYZColorArray(xyz, observer="2", illuminant=target_illuminant)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(BaseRGBColor, CMYColor)
+def RGB_to_CMY(carray, *args, **kwargs):
+    """
+    RGB to CMY conversion.
+
+    NOTE: CMYK and CMY values range from 0.0 to 1.0
+    """
+    return CMYColorArray(1.0 - carray.data)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(CMYColor, BaseRGBColor)
+def CMY_to_RGB(carray, target_rgb, *args, **kwargs):
+    """
+    Converts CMY to RGB via simple subtraction.
+    """
+    return RGBColorArray(1.0 - carray.data, rgb_type=target_rgb)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(CMYColor, CMYKColor)
+def CMY_to_CMYK(carray, *args, **kwargs):
+    """
+    Converts from CMY to CMYK.
+
+    NOTE: CMYK and CMY values range from 0.0 to 1.0
+    """
+    return CMYKColorArray(_cmy_to_cmyk(carray.data))
+
+
+def _cmy_to_cmyk(cmy):
+    """
+    Does the actual work for :py:func:`CMY_to_CMYK` and
+    :py:func:`RGB_to_CMYK`.
+
+    :param numpy.ndarray cmy: (n, 3) array of CMY colors.
+    :rtype: numpy.ndarray
+    :returns: (n, 4) array of CMYK colors.
+    """
+    var_k = numpy.minimum(cmy.min(axis=1), 1.0)
+
+    # Black colors have no C, M and Y. Dividing by one keeps them out of the
+    # way of a division by zero, they are cleared afterwards.
+    black = var_k == 1
+    denom = 1.0 - var_k
+    denom[black] = 1.0
+
+    cmyk = numpy.empty((cmy.shape[0], 4))
+    cmyk[:, :3] = (cmy - var_k[:, numpy.newaxis]) / denom[:, numpy.newaxis]
+    cmyk[black, :3] = 0.0
+    cmyk[:, 3] = var_k
+    return cmyk
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(CMYKColor, CMYColor)
+def CMYK_to_CMY(carray, *args, **kwargs):
+    """
+    Converts CMYK to CMY.
+
+    NOTE: CMYK and CMY values range from 0.0 to 1.0
+    """
+    cmyk_k = carray.data[:, 3:]
+    return CMYColorArray(carray.data[:, :3] * (1.0 - cmyk_k) + cmyk_k)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(CMYKColor, BaseRGBColor)
+def CMYK_to_RGB(carray, target_rgb, *args, **kwargs):
+    """
+    Converts CMYK to RGB. Same as CMYK_to_CMY followed by CMY_to_RGB, in a
+    single step.
+    """
+    cmyk = carray.data
+    rgb = (1.0 - cmyk[:, :3]) * (1.0 - cmyk[:, 3:])
+    return RGBColorArray(rgb, rgb_type=target_rgb)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_array_conversion_function(BaseRGBColor, CMYKColor)
+def RGB_to_CMYK(carray, *args, **kwargs):
+    """
+    Converts RGB to CMYK. Same as RGB_to_CMY followed by CMY_to_CMYK, in a
+    single step.
+    """
+    return CMYKColorArray(_cmy_to_cmyk(1.0 - carray.data))
+
+
+def convert_color_array(
+    color_array,
+    target_cs,
+    through_rgb_type=sRGBColor,
+    target_illuminant=None,
+    *args,
+    **kwargs
+):
+    """
+    Converts all colors of a color array to the designated color space.
+
+    :param color_array: A color array instance to convert, for example
+        :py:class:`LabColorArray`.
+    :param target_cs: The Color class to convert to, for example
+        :py:class:`XYZColor <colormath.color_objects.XYZColor>`. Note that this
+        is the class of a single color, not a color array.
+    :keyword BaseRGBColor through_rgb_type: If during your conversion between
+        your original and target color spaces you have to pass through RGB,
+        this determines which kind of RGB to use.
+    :type target_illuminant: None or str
+    :keyword target_illuminant: If during conversion from RGB to a reflective
+        color space you want to explicitly end up with a certain illuminant,
+        pass this here. Otherwise the RGB space's native illuminant
+        will be used.
+    :returns: A color array holding colors of the type passed in as
+        ``target_cs``.
+    :raises: :py:exc:`colormath.color_exceptions.UndefinedConversionError`
+        if conversion between the two color spaces isn't possible.
+    """
+    if isinstance(target_cs, str):
+        raise ValueError("target_cs parameter must be a Color object.")
+    if not issubclass(target_cs, ColorBase):
+        raise ValueError("target_cs parameter must be a Color object.")
+
+    # All steps of the conversion path, composed into a single function.
+    convert = _conversion_manager.get_conversion_function(
+        color_array.color_type, target_cs
+    )
+
+    if issubclass(target_cs, BaseRGBColor):
+        # Make sure the conversion returns the requested RGB colorspace.
+        through_rgb_type = target_cs
+
+    new_array = color_array
+    if convert is not None:
+        new_array = convert(
+            new_array, through_rgb_type, target_illuminant, *args, **kwargs
+        )
+
+    return new_array
@@ -33,7 +33,7 @@ from colormath.color_objects import (
     SpectralColor,
     BT2020Color,
 )
-from colormath.chromatic_adaptation import apply_chromatic_adaptation
+from colormath.chromatic_adaptation import _get_adaptation_matrix
 from colormath.color_exceptions import InvalidIlluminantError, UndefinedConversionError
 
 
@@ -62,13 +62,58 @@ def apply_RGB_matrix(var1, var2, var3, rgb_type, convtype="xyz_to_rgb"):
     # Perform the adaptation via matrix multiplication.
     result_matrix = numpy.dot(rgb_matrix, var_matrix)
     rgb_r, rgb_g, rgb_b = result_matrix
-    # Clamp these values to a valid range.
-    rgb_r = max(rgb_r, 0.0)
-    rgb_g = max(rgb_g, 0.0)
-    rgb_b = max(rgb_b, 0.0)
+    # Clamp these values to a valid range. Conditional expressions are a lot
+    # cheaper than calling max(), and leave NaN alone the same way.
+    rgb_r = 0.0 if rgb_r < 0.0 else rgb_r
+    rgb_g = 0.0 if rgb_g < 0.0 else rgb_g
+    rgb_b = 0.0 if rgb_b < 0.0 else rgb_b
     return rgb_r, rgb_g, rgb_b
 
 
+# Template for the functions generated by _compose_conversion_path(). Extra
+# arguments are rare, so the common case can use plain keyword calls instead
+# of unpacking *args and **kwargs at every step.
+_CONVERSION_PATH_TEMPLATE = """\
+def conversion_path(cobj, target_rgb, target_illuminant, *args, **kwargs):
+    if args or kwargs:
+        return %s
+    return %s
+"""
+
+
+def _compose_conversion_path(path):
+    """
+    Generates a single function that runs a color through every conversion
+    function in ``path``, like ``f1(f0(cobj, ...), ...)``. This saves walking
+    the path in a Python loop on every conversion.
+
+    :param path: Sequence of conversion functions.
+    :return: A function taking the color, ``target_rgb`` and
+        ``target_illuminant``, followed by any extra arguments for the
+        conversion functions. None if the path is empty.
+    """
+    if not path:
+        # Converting to the same color space, there is nothing to do.
+        return None
+
+    namespace = {}
+    call = "cobj"
+    call_with_extras = "cobj"
+    for index, func in enumerate(path):
+        name = "f%d" % index
+        namespace[name] = func
+        call = "%s(%s, target_rgb=target_rgb, target_illuminant=target_illuminant)" % (
+            name,
+            call,
+        )
+        call_with_extras = (
+            "%s(%s, target_rgb=target_rgb, target_illuminant=target_illuminant, "
+            "*args, **kwargs)" % (name, call_with_extras)
+        )
+    exec(_CONVERSION_PATH_TEMPLATE % (call_with_extras, call), namespace)
+    return namespace["conversion_path"]
+
+
 class ConversionManager(object):
     __metaclass__ = ABCMeta
 
@@ -102,6 +147,20 @@ class ConversionManager(object):
         """
         pass
 
+    def get_conversion_function(self, start_type, target_type):
+        """
+        Return a single function that applies the whole conversion path
+        between the two color spaces, see :py:meth:`get_conversion_path`.
+
+        :param start_type: Starting color space type.
+        :param target_type: Target color space type.
+        :return: Conversion function, or None if both types are the same
+            color space.
+        """
+        return _compose_conversion_path(
+            self.get_conversion_path(start_type, target_type)
+        )
+
     @staticmethod
     def _normalise_type(color_type):
         """
@@ -118,17 +177,55 @@ class GraphConversionManager(ConversionManager):
     def __init__(self):
         super(GraphConversionManager, self).__init__()
         self.conversion_graph = networkx.DiGraph()
+        # Shortest paths are looked up on every conversion, but the graph only
+        # changes when a conversion is registered. Cache the resolved paths,
+        # keyed by (start_type, target_type) as passed in, so the types are
+        # only normalised the first time a pair is seen.
+        self._path_cache = {}
+        # Composed conversion functions, cached the same way.
+        self._function_cache = {}
+        # Many pairs share the same path, for example every RGB space to Lab.
+        # Each distinct path is only stored once, and only composed once.
+        self._interned_paths = {}
+        self._composed_paths = {}
+
+    def get_conversion_function(self, start_type, target_type):
+        cache_key = (start_type, target_type)
+        try:
+            return self._function_cache[cache_key]
+        except KeyError:
+            path = self._get_path(start_type, target_type)
+            try:
+                func = self._composed_paths[path]
+            except KeyError:
+                func = _compose_conversion_path(path)
+                self._composed_paths[path] = func
+            self._function_cache[cache_key] = func
+            return func
 
     def get_conversion_path(self, start_type, target_type):
-        start_type = self._normalise_type(start_type)
-        target_type = self._normalise_type(target_type)
-        try:
-            # Retrieve node sequence that leads from start_type to target_type.
-            return self._find_shortest_path(start_type, target_type)
-        except (networkx.NetworkXNoPath, networkx.NodeNotFound):
-            raise UndefinedConversionError(
-                start_type, target_type,
-            )
+        return list(self._get_path(start_type, target_type))
+
+    def _get_path(self, start_type, target_type):
+        """
+        Same as :py:meth:`get_conversion_path`, but returns the cached tuple
+        shared by all pairs with the same path.
+        """
+        cache_key = (start_type, target_type)
+        path = self._path_cache.get(cache_key)
+        if path is None:
+            start_type = self._normalise_type(start_type)
+            target_type = self._normalise_type(target_type)
+            try:
+                # Retrieve node sequence that leads from start_type to target_type.
+                path = tuple(self._find_shortest_path(start_type, target_type))
+            except (networkx.NetworkXNoPath, networkx.NodeNotFound):
+                raise UndefinedConversionError(
+                    start_type, target_type,
+                )
+            path = self._interned_paths.setdefault(path, path)
+            self._path_cache[cache_key] = path
+        return path
 
     def _find_shortest_path(self, start_type, target_type):
         path = networkx.shortest_path(self.conversion_graph, start_type, target_type)
@@ -146,6 +243,11 @@ class GraphConversionManager(ConversionManager):
         self.conversion_graph.add_edge(
             start_type, target_type, conversion_function=conversion_function
         )
+        # A new edge may shorten (or create) any path, so start over.
+        self._path_cache.clear()
+        self._function_cache.clear()
+        self._interned_paths.clear()
+        self._composed_paths.clear()
 
 
 class DummyConversionManager(ConversionManager):
@@ -186,25 +288,25 @@ def color_conversion_function(start_type, target_type):
     return decorator
 
 
-# noinspection PyPep8Naming,PyUnusedLocal
-@color_conversion_function(SpectralColor, XYZColor)
-def Spectral_to_XYZ(cobj, illuminant_override=None, *args, **kwargs):
+# Spectral_to_XYZ weighting matrices for the standard illuminants, keyed by
+# (observer, illuminant). They only depend on constants, so each one is only
+# built once.
+_SPECTRAL_WEIGHTS_CACHE = {}
+
+
+def _get_spectral_weights(observer, reference_illum):
     """
-    Converts spectral readings to XYZ.
+    Weights the observer's color matching functions by the reference
+    illuminant's power distribution. Each row of the returned (3, n) matrix
+    turns a spectral sample into one of the X, Y, and Z coordinates.
+
+    :param str observer: Observer angle, '2' or '10' degrees.
+    :param numpy.ndarray reference_illum: The illuminant's spectral power
+        distribution.
+    :rtype: numpy.ndarray
     """
-    # If the user provides an illuminant_override numpy array, use it.
-    if illuminant_override:
-        reference_illum = illuminant_override
-    else:
-        # Otherwise, look up the illuminant from known standards based
-        # on the value of 'illuminant' pulled from the SpectralColor object.
-        try:
-            reference_illum = spectral_constants.REF_ILLUM_TABLE[cobj.illuminant]
-        except KeyError:
-            raise InvalidIlluminantError(cobj.illuminant)
-
     # Get the spectral distribution of the selected standard observer.
-    if cobj.observer == "10":
+    if observer == "10":
         std_obs_x = spectral_constants.STDOBSERV_X10
         std_obs_y = spectral_constants.STDOBSERV_Y10
         std_obs_z = spectral_constants.STDOBSERV_Z10
@@ -214,26 +316,39 @@ def Spectral_to_XYZ(cobj, illuminant_override=None, *args, **kwargs):
         std_obs_y = spectral_constants.STDOBSERV_Y2
         std_obs_z = spectral_constants.STDOBSERV_Z2
 
-    # This is a NumPy array containing the spectral distribution of the color.
-    sample = cobj.get_numpy_array()
-
+    weights = numpy.vstack((std_obs_x, std_obs_y, std_obs_z)) * reference_illum
     # The denominator is constant throughout the entire calculation for X,
-    # Y, and Z coordinates. Calculate it once and re-use.
-    denom = std_obs_y * reference_illum
+    # Y, and Z coordinates, so fold it into the weights.
+    return weights / weights[1].sum()
 
-    # This is also a common element in the calculation whereby the sample
-    # NumPy array is multiplied by the reference illuminant's power distribution
-    # (which is also a NumPy array).
-    sample_by_ref_illum = sample * reference_illum
 
-    # Calculate the numerator of the equation to find X.
-    x_numerator = sample_by_ref_illum * std_obs_x
-    y_numerator = sample_by_ref_illum * std_obs_y
-    z_numerator = sample_by_ref_illum * std_obs_z
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_conversion_function(SpectralColor, XYZColor)
+def Spectral_to_XYZ(cobj, illuminant_override=None, *args, **kwargs):
+    """
+    Converts spectral readings to XYZ.
+    """
+    # If the user provides an illuminant_override numpy array, use it.
+    if illuminant_override is not None:
+        weights = _get_spectral_weights(cobj.observer, illuminant_override)
+    else:
+        # Otherwise, look up the illuminant from known standards based
+        # on the value of 'illuminant' pulled from the SpectralColor object.
+        cache_key = (cobj.observer, cobj.illuminant)
+        weights = _SPECTRAL_WEIGHTS_CACHE.get(cache_key)
+        if weights is None:
+            try:
+                reference_illum = spectral_constants.REF_ILLUM_TABLE[cobj.illuminant]
+            except KeyError:
+                raise InvalidIlluminantError(cobj.illuminant)
+            weights = _get_spectral_weights(cobj.observer, reference_illum)
+            weights.flags.writeable = False
+            _SPECTRAL_WEIGHTS_CACHE[cache_key] = weights
 
-    xyz_x = x_numerator.sum() / denom.sum()
-    xyz_y = y_numerator.sum() / denom.sum()
-    xyz_z = z_numerator.sum() / denom.sum()
+    # This is a NumPy array containing the spectral distribution of the color.
+    sample = cobj.get_numpy_array()[0]
+
+    xyz_x, xyz_y, xyz_z = numpy.dot(weights, sample)
 
     return XYZColor(
         xyz_x, xyz_y, xyz_z, observer=cobj.observer, illuminant=cobj.illuminant
@@ -266,7 +381,7 @@ def Lab_to_XYZ(cobj, *args, **kwargs):
     """
     Convert from Lab to XYZ
     """
-    illum = cobj.get_illuminant_xyz()
+    illum_x, illum_y, illum_z = cobj._get_illuminant_xyz_tuple()
     xyz_y = (cobj.lab_l + 16.0) / 116.0
     xyz_x = cobj.lab_a / 500.0 + xyz_y
     xyz_z = xyz_y - cobj.lab_b / 200.0
@@ -286,9 +401,9 @@ def Lab_to_XYZ(cobj, *args, **kwargs):
     else:
         xyz_z = (xyz_z - 16.0 / 116.0) / 7.787
 
-    xyz_x = illum["X"] * xyz_x
-    xyz_y = illum["Y"] * xyz_y
-    xyz_z = illum["Z"] * xyz_z
+    xyz_x = illum_x * xyz_x
+    xyz_y = illum_y * xyz_y
+    xyz_z = illum_z * xyz_z
 
     return XYZColor(
         xyz_x, xyz_y, xyz_z, observer=cobj.observer, illuminant=cobj.illuminant
@@ -320,7 +435,7 @@ def Luv_to_XYZ(cobj, *args, **kwargs):
     """
     Convert from Luv to XYZ.
     """
-    illum = cobj.get_illuminant_xyz()
+    illum_x, illum_y, illum_z = cobj._get_illuminant_xyz_tuple()
     # Without Light, there is no color. Short-circuit this and avoid some
     # zero division errors in the var_a_frac calculation.
     if cobj.luv_l <= 0.0:
@@ -333,8 +448,8 @@ def Luv_to_XYZ(cobj, *args, **kwargs):
 
     # Various variables used throughout the conversion.
     cie_k_times_e = color_constants.CIE_K * color_constants.CIE_E
-    u_sub_0 = (4.0 * illum["X"]) / (illum["X"] + 15.0 * illum["Y"] + 3.0 * illum["Z"])
-    v_sub_0 = (9.0 * illum["Y"]) / (illum["X"] + 15.0 * illum["Y"] + 3.0 * illum["Z"])
+    u_sub_0 = (4.0 * illum_x) / (illum_x + 15.0 * illum_y + 3.0 * illum_z)
+    v_sub_0 = (9.0 * illum_y) / (illum_x + 15.0 * illum_y + 3.0 * illum_z)
     var_u = cobj.luv_u / (13.0 * cobj.luv_l) + u_sub_0
     var_v = cobj.luv_v / (13.0 * cobj.luv_l) + v_sub_0
 
@@ -442,15 +557,15 @@ def XYZ_to_Luv(cobj, *args, **kwargs):
         luv_u = (4.0 * temp_x) / denom
         luv_v = (9.0 * temp_y) / denom
 
-    illum = cobj.get_illuminant_xyz()
-    temp_y = temp_y / illum["Y"]
+    illum_x, illum_y, illum_z = cobj._get_illuminant_xyz_tuple()
+    temp_y = temp_y / illum_y
     if temp_y > color_constants.CIE_E:
         temp_y = math.pow(temp_y, (1.0 / 3.0))
     else:
         temp_y = (7.787 * temp_y) + (16.0 / 116.0)
 
-    ref_U = (4.0 * illum["X"]) / (illum["X"] + (15.0 * illum["Y"]) + (3.0 * illum["Z"]))
-    ref_V = (9.0 * illum["Y"]) / (illum["X"] + (15.0 * illum["Y"]) + (3.0 * illum["Z"]))
+    ref_U = (4.0 * illum_x) / (illum_x + (15.0 * illum_y) + (3.0 * illum_z))
+    ref_V = (9.0 * illum_y) / (illum_x + (15.0 * illum_y) + (3.0 * illum_z))
 
     luv_l = (116.0 * temp_y) - 16.0
     luv_u = 13.0 * luv_l * (luv_u - ref_U)
@@ -467,10 +582,10 @@ def XYZ_to_Lab(cobj, *args, **kwargs):
     """
     Converts XYZ to Lab.
     """
-    illum = cobj.get_illuminant_xyz()
-    temp_x = cobj.xyz_x / illum["X"]
-    temp_y = cobj.xyz_y / illum["Y"]
-    temp_z = cobj.xyz_z / illum["Z"]
+    illum_x, illum_y, illum_z = cobj._get_illuminant_xyz_tuple()
+    temp_x = cobj.xyz_x / illum_x
+    temp_y = cobj.xyz_y / illum_y
+    temp_z = cobj.xyz_z / illum_z
 
     if temp_x > color_constants.CIE_E:
         temp_x = math.pow(temp_x, (1.0 / 3.0))
@@ -495,40 +610,56 @@ def XYZ_to_Lab(cobj, *args, **kwargs):
     )
 
 
+# XYZ_to_RGB matrices, keyed by (target_rgb, illuminant of the XYZ color).
+_XYZ_TO_RGB_MATRIX_CACHE = {}
+
+
+def _get_xyz_to_rgb_matrix(target_rgb, illuminant):
+    """
+    Returns the XYZ to RGB working space matrix of ``target_rgb`` for XYZ
+    colors with the given illuminant. If the XYZ values were taken with a
+    different reference white than the native reference white of the target
+    RGB space, the chromatic adaptation between the two is folded into the
+    matrix, so a single matrix product does both.
+
+    :param target_rgb: The RGB color space class.
+    :param str illuminant: The illuminant of the XYZ colors.
+    :rtype: numpy.ndarray
+    """
+    cache_key = (target_rgb, illuminant)
+    rgb_matrix = _XYZ_TO_RGB_MATRIX_CACHE.get(cache_key)
+    if rgb_matrix is None:
+        rgb_matrix = numpy.array(target_rgb.conversion_matrices["xyz_to_rgb"])
+        target_illum = target_rgb.native_illuminant
+        if illuminant != target_illum:
+            adaptation_matrix = _get_adaptation_matrix(
+                illuminant.lower(), target_illum, "2", "bradford"
+            )
+            rgb_matrix = numpy.dot(rgb_matrix, adaptation_matrix)
+        rgb_matrix.flags.writeable = False
+        _XYZ_TO_RGB_MATRIX_CACHE[cache_key] = rgb_matrix
+    return rgb_matrix
+
+
 # noinspection PyPep8Naming,PyUnusedLocal
 @color_conversion_function(XYZColor, BaseRGBColor)
 def XYZ_to_RGB(cobj, target_rgb, *args, **kwargs):
     """
     XYZ to RGB conversion.
     """
-    temp_X = cobj.xyz_x
-    temp_Y = cobj.xyz_y
-    temp_Z = cobj.xyz_z
-
-    logger.debug("  \\- Target RGB space: %s", target_rgb)
-    target_illum = target_rgb.native_illuminant
-    logger.debug("  \\- Target native illuminant: %s", target_illum)
-    logger.debug("  \\- XYZ color's illuminant: %s", cobj.illuminant)
-
-    # If the XYZ values were taken with a different reference white than the
-    # native reference white of the target RGB space, a transformation matrix
-    # must be applied.
-    if cobj.illuminant != target_illum:
-        logger.debug(
-            "  \\* Applying transformation from %s to %s ",
-            cobj.illuminant,
-            target_illum,
-        )
-        # Get the adjusted XYZ values, adapted for the target illuminant.
-        temp_X, temp_Y, temp_Z = apply_chromatic_adaptation(
-            temp_X, temp_Y, temp_Z, orig_illum=cobj.illuminant, targ_illum=target_illum
-        )
-        logger.debug("  \\*   New values: %.3f, %.3f, %.3f", temp_X, temp_Y, temp_Z)
-
-    # Apply an RGB working space matrix to the XYZ values (matrix mul).
-    rgb_r, rgb_g, rgb_b = apply_RGB_matrix(
-        temp_X, temp_Y, temp_Z, rgb_type=target_rgb, convtype="xyz_to_rgb"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  \\- Target RGB space: %s", target_rgb)
+        logger.debug("  \\- Target native illuminant: %s", target_rgb.native_illuminant)
+        logger.debug("  \\- XYZ color's illuminant: %s", cobj.illuminant)
+
+    # Apply the RGB working space matrix, which includes the adaptation to the
+    # RGB space's native illuminant if needed, to the XYZ values.
+    rgb_matrix = _get_xyz_to_rgb_matrix(target_rgb, cobj.illuminant)
+    rgb_r, rgb_g, rgb_b = numpy.dot(rgb_matrix, (cobj.xyz_x, cobj.xyz_y, cobj.xyz_z))
+    # Clamp these values to a valid range, see apply_RGB_matrix().
+    rgb_r = 0.0 if rgb_r < 0.0 else rgb_r
+    rgb_g = 0.0 if rgb_g < 0.0 else rgb_g
+    rgb_b = 0.0 if rgb_b < 0.0 else rgb_b
 
     # v
     linear_channels = dict(r=rgb_r, g=rgb_g, b=rgb_b)
@@ -891,6 +1022,55 @@ def CMYK_to_CMY(cobj, *args, **kwargs):
     return CMYColor(cmy_c, cmy_m, cmy_y)
 
 
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_conversion_function(CMYKColor, BaseRGBColor)
+def CMYK_to_RGB(cobj, target_rgb, *args, **kwargs):
+    """
+    Converts CMYK to RGB. Same as CMYK_to_CMY followed by CMY_to_RGB, in a
+    single step.
+    """
+    var_k = 1.0 - cobj.cmyk_k
+    rgb_r = (1.0 - cobj.cmyk_c) * var_k
+    rgb_g = (1.0 - cobj.cmyk_m) * var_k
+    rgb_b = (1.0 - cobj.cmyk_y) * var_k
+
+    return target_rgb(rgb_r, rgb_g, rgb_b)
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+@color_conversion_function(BaseRGBColor, CMYKColor)
+def RGB_to_CMYK(cobj, *args, **kwargs):
+    """
+    Converts RGB to CMYK. Same as RGB_to_CMY followed by CMY_to_CMYK, in a
+    single step.
+
+    NOTE: CMYK values range from 0.0 to 1.0
+    """
+    cmy_c = 1.0 - cobj.rgb_r
+    cmy_m = 1.0 - cobj.rgb_g
+    cmy_y = 1.0 - cobj.rgb_b
+
+    var_k = 1.0
+    if cmy_c < var_k:
+        var_k = cmy_c
+    if cmy_m < var_k:
+        var_k = cmy_m
+    if cmy_y < var_k:
+        var_k = cmy_y
+
+    if var_k == 1:
+        cmyk_c = 0.0
+        cmyk_m = 0.0
+        cmyk_y = 0.0
+    else:
+        cmyk_c = (cmy_c - var_k) / (1.0 - var_k)
+        cmyk_m = (cmy_m - var_k) / (1.0 - var_k)
+        cmyk_y = (cmy_y - var_k) / (1.0 - var_k)
+    cmyk_k = var_k
+
+    return CMYKColor(cmyk_c, cmyk_m, cmyk_y, cmyk_k)
+
+
 # noinspection PyPep8Naming,PyUnusedLocal
 @color_conversion_function(XYZColor, IPTColor)
 def XYZ_to_IPT(cobj, *args, **kwargs):
@@ -914,6 +1094,11 @@ def XYZ_to_IPT(cobj, *args, **kwargs):
     return IPTColor(*ipt_values)
 
 
+# The inverses of IPTColor's conversion matrices, for IPT_to_XYZ().
+_IPT_TO_LMS_MATRIX = numpy.linalg.inv(IPTColor.conversion_matrices["lms_to_ipt"])
+_LMS_TO_XYZ_MATRIX = numpy.linalg.inv(IPTColor.conversion_matrices["xyz_to_lms"])
+
+
 # noinspection PyPep8Naming,PyUnusedLocal
 @color_conversion_function(IPTColor, XYZColor)
 def IPT_to_XYZ(cobj, *args, **kwargs):
@@ -921,35 +1106,14 @@ def IPT_to_XYZ(cobj, *args, **kwargs):
     Converts IPT to XYZ.
     """
     ipt_values = numpy.array(cobj.get_value_tuple())
-    lms_values = numpy.dot(
-        numpy.linalg.inv(IPTColor.conversion_matrices["lms_to_ipt"]), ipt_values
-    )
+    lms_values = numpy.dot(_IPT_TO_LMS_MATRIX, ipt_values)
 
     lms_prime = numpy.sign(lms_values) * numpy.abs(lms_values) ** (1 / 0.43)
 
-    xyz_values = numpy.dot(
-        numpy.linalg.inv(IPTColor.conversion_matrices["xyz_to_lms"]), lms_prime
-    )
+    xyz_values = numpy.dot(_LMS_TO_XYZ_MATRIX, lms_prime)
     return XYZColor(*xyz_values, observer="2", illuminant="d65")
 
 
-# We use this as a template conversion dict for each RGB color space. They
-# are all identical.
-_RGB_CONVERSION_DICT_TEMPLATE = {
-    "HSLColor": [RGB_to_HSL],
-    "HSVColor": [RGB_to_HSV],
-    "CMYColor": [RGB_to_CMY],
-    "CMYKColor": [RGB_to_CMY, CMY_to_CMYK],
-    "XYZColor": [RGB_to_XYZ],
-    "xyYColor": [RGB_to_XYZ, XYZ_to_xyY],
-    "LabColor": [RGB_to_XYZ, XYZ_to_Lab],
-    "LCHabColor": [RGB_to_XYZ, XYZ_to_Lab, Lab_to_LCHab],
-    "LCHuvColor": [RGB_to_XYZ, XYZ_to_Luv, Luv_to_LCHuv],
-    "LuvColor": [RGB_to_XYZ, XYZ_to_Luv],
-    "IPTColor": [RGB_to_XYZ, XYZ_to_IPT],
-}
-
-
 def convert_color(
     color,
     target_cs,
@@ -983,20 +1147,37 @@ def convert_color(
     if not issubclass(target_cs, ColorBase):
         raise ValueError("target_cs parameter must be a Color object.")
 
-    conversions = _conversion_manager.get_conversion_path(color.__class__, target_cs)
-
-    logger.debug("Converting %s to %s", color, target_cs)
-    logger.debug(" @ Conversion path: %s", conversions)
-
-    # Start with original color in case we convert to the same color space.
-    new_color = color
-
     if issubclass(target_cs, BaseRGBColor):
         # If the target_cs is an RGB color space of some sort, then we
         # have to set our through_rgb_type to make sure the conversion returns
         # the expected RGB colorspace (instead of defaulting to sRGBColor).
         through_rgb_type = target_cs
 
+    if color.__class__ is target_cs:
+        # Nothing to convert, the color is already in the target color space.
+        if through_rgb_type != sRGBColor:
+            color._through_rgb_type = through_rgb_type
+        return color
+
+    # Formatting the colors for the debug output is comparatively expensive, so
+    # only check the log level once rather than on every conversion step.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        # Walk the conversion path step by step, so every intermediate color
+        # can be logged.
+        conversions = _conversion_manager.get_conversion_path(
+            color.__class__, target_cs
+        )
+        logger.debug("Converting %s to %s", color, target_cs)
+        logger.debug(" @ Conversion path: %s", conversions)
+    else:
+        # Otherwise run the whole path in a single call.
+        convert = _conversion_manager.get_conversion_function(
+            color.__class__, target_cs
+        )
+
+    new_color = color
+
     # We have to be careful to use the same RGB color space that created
     # an object (if it was created by a conversion) in order to get correct
     # results. For example, XYZ->HSL via Adobe RGB should default to Adobe
@@ -1016,20 +1197,18 @@ def convert_color(
         # but I think this reads better.
         target_rgb = through_rgb_type
 
-    # Iterate through the list of functions for the conversion path, storing
-    # the results in a dictionary via update(). This way the user has access
-    # to all of the variables involved in the conversion.
-    for func in conversions:
-        # Execute the function in this conversion step and store the resulting
-        # Color object.
-        logger.debug(
-            " * Conversion: %s passed to %s()", new_color.__class__.__name__, func
-        )
-        logger.debug(" |->  in %s", new_color)
+    if debug:
+        # Iterate through the list of functions for the conversion path,
+        # storing the results in a dictionary via update(). This way the user
+        # has access to all of the variables involved in the conversion.
+        for func in conversions:
+            # Execute the function in this conversion step and store the
+            # resulting Color object.
+            logger.debug(
+                " * Conversion: %s passed to %s()", new_color.__class__.__name__, func
+            )
+            logger.debug(" |->  in %s", new_color)
 
-        if func:
-            # This can be None if you try to convert a color to the color
-            # space that is already in. IE: XYZ->XYZ.
             new_color = func(
                 new_color,
                 target_rgb=target_rgb,
@@ -1038,7 +1217,9 @@ def convert_color(
                 **kwargs
             )
 
-        logger.debug(" |-< out %s", new_color)
+            logger.debug(" |-< out %s", new_color)
+    elif convert is not None:
+        new_color = convert(new_color, target_rgb, target_illuminant, *args, **kwargs)
 
     # If this conversion had something other than the default sRGB color space
     # requested,
@@ -8,6 +8,38 @@ calls can be used to efficiently compare large volumes of Lab colors.
 import numpy
 
 
+def _prune_top_k(lower_bound, delta_e_rows, top_k, estimate=None):
+    """
+    Only calculates the Delta E for the rows that can be among the `top_k`
+    closest colors, all other rows are set to ``numpy.inf``.
+
+    :param numpy.ndarray lower_bound: A cheap lower bound of every row's
+        Delta E.
+    :param delta_e_rows: Callable taking an array of row indices and returning
+        the Delta E of those rows.
+    :param int top_k: Number of closest colors that must be exact.
+    :param numpy.ndarray estimate: Cheap guess of every row's Delta E, used to
+        pick the initial candidates. Defaults to `lower_bound`.
+    """
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1.")
+    if top_k >= lower_bound.shape[0]:
+        return delta_e_rows(numpy.arange(lower_bound.shape[0]))
+    if estimate is None:
+        estimate = lower_bound
+
+    # The k rows that are estimated to be the closest give an upper limit for
+    # the k-th smallest Delta E. Every row whose bound is above that limit
+    # can't make it into the top k, so it is never calculated.
+    candidates = numpy.argpartition(estimate, top_k - 1)[:top_k]
+    limit = delta_e_rows(candidates).max()
+    survivors = numpy.flatnonzero(lower_bound <= limit)
+
+    delta_e = numpy.full(lower_bound.shape[0], numpy.inf)
+    delta_e[survivors] = delta_e_rows(survivors)
+    return delta_e
+
+
 def delta_e_cie1976(lab_color_vector, lab_color_matrix):
     """
     Calculates the Delta E (CIE1976) between `lab_color_vector` and all
@@ -112,16 +144,19 @@ def delta_e_cmc(lab_color_vector, lab_color_matrix, pl=2, pc=1):
 
 
 # noinspection PyPep8Naming
-def delta_e_cie2000(lab_color_vector, lab_color_matrix, Kl=1, Kc=1, Kh=1):
+def _delta_e_cie2000(lab_colors_1, lab_colors_2, Kl, Kc, Kh):
     """
-    Calculates the Delta E (CIE2000) of two colors.
+    CIE2000 kernel shared by :py:func:`delta_e_cie2000` and
+    :py:func:`delta_e_cie2000_pairwise`. Both arguments hold Lab values along
+    their last axis, all other axes are broadcast against each other.
     """
-    L, a, b = lab_color_vector
+    L1, a1, b1 = lab_colors_1[..., 0], lab_colors_1[..., 1], lab_colors_1[..., 2]
+    L2, a2, b2 = lab_colors_2[..., 0], lab_colors_2[..., 1], lab_colors_2[..., 2]
 
-    avg_Lp = (L + lab_color_matrix[:, 0]) / 2.0
+    avg_Lp = (L1 + L2) / 2.0
 
-    C1 = numpy.sqrt(numpy.sum(numpy.power(lab_color_vector[1:], 2)))
-    C2 = numpy.sqrt(numpy.sum(numpy.power(lab_color_matrix[:, 1:], 2), axis=1))
+    C1 = numpy.sqrt(numpy.power(a1, 2) + numpy.power(b1, 2))
+    C2 = numpy.sqrt(numpy.power(a2, 2) + numpy.power(b2, 2))
 
     avg_C1_C2 = (C1 + C2) / 2.0
 
@@ -133,18 +168,18 @@ def delta_e_cie2000(lab_color_vector, lab_color_matrix, Kl=1, Kc=1, Kh=1):
         )
     )
 
-    a1p = (1.0 + G) * a
-    a2p = (1.0 + G) * lab_color_matrix[:, 1]
+    a1p = (1.0 + G) * a1
+    a2p = (1.0 + G) * a2
 
-    C1p = numpy.sqrt(numpy.power(a1p, 2) + numpy.power(b, 2))
-    C2p = numpy.sqrt(numpy.power(a2p, 2) + numpy.power(lab_color_matrix[:, 2], 2))
+    C1p = numpy.sqrt(numpy.power(a1p, 2) + numpy.power(b1, 2))
+    C2p = numpy.sqrt(numpy.power(a2p, 2) + numpy.power(b2, 2))
 
     avg_C1p_C2p = (C1p + C2p) / 2.0
 
-    h1p = numpy.degrees(numpy.arctan2(b, a1p))
+    h1p = numpy.degrees(numpy.arctan2(b1, a1p))
     h1p += (h1p < 0) * 360
 
-    h2p = numpy.degrees(numpy.arctan2(lab_color_matrix[:, 2], a2p))
+    h2p = numpy.degrees(numpy.arctan2(b2, a2p))
     h2p += (h2p < 0) * 360
 
     avg_Hp = (((numpy.fabs(h1p - h2p) > 180) * 360) + h1p + h2p) / 2.0
@@ -161,7 +196,7 @@ def delta_e_cie2000(lab_color_vector, lab_color_matrix, Kl=1, Kc=1, Kh=1):
     delta_hp = diff_h2p_h1p + (numpy.fabs(diff_h2p_h1p) > 180) * 360
     delta_hp -= (h2p > h1p) * 720
 
-    delta_Lp = lab_color_matrix[:, 0] - L
+    delta_Lp = L2 - L1
     delta_Cp = C2p - C1p
     delta_Hp = 2 * numpy.sqrt(C2p * C1p) * numpy.sin(numpy.radians(delta_hp) / 2.0)
 
@@ -185,3 +220,60 @@ def delta_e_cie2000(lab_color_vector, lab_color_matrix, Kl=1, Kc=1, Kh=1):
         + numpy.power(delta_Hp / (S_H * Kh), 2)
         + R_T * (delta_Cp / (S_C * Kc)) * (delta_Hp / (S_H * Kh))
     )
+
+
+# noinspection PyPep8Naming
+def delta_e_cie2000(lab_color_vector, lab_color_matrix, Kl=1, Kc=1, Kh=1, top_k=None):
+    """
+    Calculates the Delta E (CIE2000) of two colors.
+
+    :keyword int top_k: If given, only the `top_k` smallest values are
+        guaranteed to be calculated. Colors that are known to be further away
+        are returned as ``numpy.inf``.
+    """
+    lab_color_vector = numpy.asarray(lab_color_vector, dtype=float)
+    lab_color_matrix = numpy.asarray(lab_color_matrix, dtype=float)
+    if top_k is None:
+        return _delta_e_cie2000(lab_color_vector, lab_color_matrix, Kl, Kc, Kh)
+
+    # The lightness term alone can never exceed the full distance, since the
+    # rotation term R_T is bounded by the chroma and hue terms.
+    avg_Lp = (lab_color_vector[0] + lab_color_matrix[:, 0]) / 2.0
+    S_L = 1 + (
+        (0.015 * numpy.power(avg_Lp - 50, 2))
+        / numpy.sqrt(20 + numpy.power(avg_Lp - 50, 2.0))
+    )
+    lower_bound = numpy.fabs(
+        (lab_color_matrix[:, 0] - lab_color_vector[0]) / (S_L * Kl)
+    )
+    # CIE1976 is cheap and close enough to find good initial candidates.
+    estimate = numpy.sum(numpy.power(lab_color_vector - lab_color_matrix, 2), axis=1)
+    return _prune_top_k(
+        lower_bound,
+        lambda rows: _delta_e_cie2000(
+            lab_color_vector, lab_color_matrix[rows], Kl, Kc, Kh
+        ),
+        top_k,
+        estimate=estimate,
+    )
+
+
+# noinspection PyPep8Naming
+def delta_e_cie2000_pairwise(lab_color_matrix_1, lab_color_matrix_2, Kl=1, Kc=1, Kh=1):
+    """
+    Calculates the Delta E (CIE2000) between every color in
+    `lab_color_matrix_1` (m, 3) and every color in `lab_color_matrix_2` (n, 3).
+
+    :rtype: numpy.ndarray
+    :returns: An (m, n) matrix, where row i holds the distances between color
+        i of `lab_color_matrix_1` and all colors in `lab_color_matrix_2`.
+    """
+    lab_color_matrix_1 = numpy.asarray(lab_color_matrix_1, dtype=float)
+    lab_color_matrix_2 = numpy.asarray(lab_color_matrix_2, dtype=float)
+    return _delta_e_cie2000(
+        lab_color_matrix_1[:, numpy.newaxis, :],
+        lab_color_matrix_2[numpy.newaxis, :, :],
+        Kl,
+        Kc,
+        Kh,
+    )
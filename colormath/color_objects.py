@@ -3,8 +3,10 @@
 This module contains classes to represent various color spaces.
 """
 
+import binascii
 import logging
 import math
+import operator
 
 import numpy
 
@@ -21,13 +23,48 @@ class ColorBase(object):
     A base class holding some common methods and values.
     """
 
+    # Colors are often created in large numbers, so they don't carry a
+    # __dict__. Sub-classes list their own attributes in __slots__.
+    __slots__ = ("_through_rgb_type",)
+
     # Attribute names containing color data on the sub-class. For example,
     # sRGBColor would be ['rgb_r', 'rgb_g', 'rgb_b']
     VALUES = []
-    # If this object as converted such that its values passed through an
-    # RGB colorspace, this is set to the class for said RGB color space.
-    # Allows reversing conversions automatically and accurately.
-    _through_rgb_type = None
+
+    def __init__(self):
+        # If this object as converted such that its values passed through an
+        # RGB colorspace, this is set to the class for said RGB color space.
+        # Allows reversing conversions automatically and accurately.
+        self._through_rgb_type = None
+
+    def _get_slot_names(self):
+        """
+        Returns the names of all __slots__ attributes of this color, from all
+        classes in its MRO.
+        """
+        names = []
+        for cls in self.__class__.__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name not in ("__dict__", "__weakref__") and name not in names:
+                    names.append(name)
+        return names
+
+    def __getstate__(self):
+        # Classes with __slots__ need this to be pickled with protocols 0 and
+        # 1 (the default on Python 2).
+        state = {}
+        for name in self._get_slot_names():
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
 
     def get_value_tuple(self):
         """
@@ -40,10 +77,48 @@ class ColorBase(object):
             retval += (getattr(self, val),)
         return retval
 
+    @classmethod
+    def _get_formatters(cls):
+        """
+        Returns the attribute getter and the templates used by
+        :py:meth:`__str__` and :py:meth:`__repr__`. These are built once per
+        class, so formatting a color doesn't have to loop over its values.
+        """
+        formatters = cls.__dict__.get("_formatters")
+        if formatters is None:
+            attributes = list(cls.VALUES)
+            str_fields = ["%s:%%.4f" % val for val in cls.VALUES]
+            repr_fields = ["%s=%%r" % val for val in cls.VALUES]
+            if issubclass(cls, IlluminantMixin):
+                attributes += ["observer", "illuminant"]
+                str_fields += ["observer:%s", "illuminant:%s"]
+                repr_fields += ["observer='%s'", "illuminant='%s'"]
+            if attributes:
+                getter = operator.attrgetter(*attributes)
+            else:
+                # attrgetter() needs at least one attribute.
+                def getter(color):
+                    return ()
+
+            formatters = (
+                getter,
+                cls.__name__ + " (" + " ".join(str_fields) + ")",
+                cls.__name__ + "(" + ", ".join(repr_fields) + ")",
+            )
+            cls._formatters = formatters
+        return formatters
+
     def __str__(self):
         """
         String representation of the color.
         """
+        getter, str_template, _ = self._get_formatters()
+        try:
+            return str_template % getter(self)
+        except TypeError:
+            # Some of the values are None, these are left out below.
+            pass
+
         retval = self.__class__.__name__ + " ("
         for val in self.VALUES:
             value = getattr(self, val, None)
@@ -59,15 +134,8 @@ class ColorBase(object):
         """
         Evaluable string representation of the object.
         """
-        retval = self.__class__.__name__ + "("
-        attributes = [(attr, getattr(self, attr)) for attr in self.VALUES]
-        values = [x + "=" + repr(y) for x, y in attributes]
-        retval += ", ".join(values)
-        if hasattr(self, "observer"):
-            retval += ", observer='" + self.observer + "'"
-        if hasattr(self, "illuminant"):
-            retval += ", illuminant='" + self.illuminant + "'"
-        return retval + ")"
+        getter, _, repr_template = self._get_formatters()
+        return repr_template % getter(self)
 
 
 class IlluminantMixin(object):
@@ -75,6 +143,8 @@ class IlluminantMixin(object):
     Color spaces that have a notion of an illuminant should inherit this.
     """
 
+    __slots__ = ()
+
     # noinspection PyAttributeOutsideInit
     def set_observer(self, observer):
         """
@@ -85,9 +155,12 @@ class IlluminantMixin(object):
 
         :param str observer: One of '2' or '10'.
         """
-        observer = str(observer)
+        # Colors created during conversions are handed values that were
+        # already validated, only normalise the ones we don't recognise.
         if observer not in color_constants.OBSERVERS:
-            raise InvalidObserverError(self)
+            observer = str(observer)
+            if observer not in color_constants.OBSERVERS:
+                raise InvalidObserverError(self)
         self.observer = observer
 
     # noinspection PyAttributeOutsideInit
@@ -104,9 +177,11 @@ class IlluminantMixin(object):
 
         :param str illuminant: One of the various illuminants.
         """
-        illuminant = illuminant.lower()
-        if illuminant not in color_constants.ILLUMINANTS[self.observer]:
-            raise InvalidIlluminantError(illuminant)
+        illuminants = color_constants.ILLUMINANTS[self.observer]
+        if illuminant not in illuminants:
+            illuminant = illuminant.lower()
+            if illuminant not in illuminants:
+                raise InvalidIlluminantError(illuminant)
         self.illuminant = illuminant
 
     def get_illuminant_xyz(self, observer=None, illuminant=None):
@@ -134,6 +209,18 @@ class IlluminantMixin(object):
 
         return {"X": illum_xyz[0], "Y": illum_xyz[1], "Z": illum_xyz[2]}
 
+    def _get_illuminant_xyz_tuple(self):
+        """
+        Same as :py:meth:`get_illuminant_xyz` for the color's own observer and
+        illuminant, but returns an (X, Y, Z) tuple instead of building a dict.
+        """
+        try:
+            return color_constants.ILLUMINANTS[self.observer][self.illuminant]
+        except (KeyError, TypeError):
+            # Let get_illuminant_xyz() raise the appropriate exception.
+            illum = self.get_illuminant_xyz()
+            return illum["X"], illum["Y"], illum["Z"]
+
 
 class SpectralColor(IlluminantMixin, ColorBase):
     """
@@ -202,6 +289,7 @@ class SpectralColor(IlluminantMixin, ColorBase):
         "spec_820nm",
         "spec_830nm",
     ]
+    __slots__ = ("_spec", "observer", "illuminant")
 
     def __init__(
         self,
@@ -264,63 +352,70 @@ class SpectralColor(IlluminantMixin, ColorBase):
         """
 
         super(SpectralColor, self).__init__()
-        # Spectral fields
-        self.spec_340nm = float(spec_340nm)
-        self.spec_350nm = float(spec_350nm)
-        self.spec_360nm = float(spec_360nm)
-        self.spec_370nm = float(spec_370nm)
-        # begin Blue wavelengths
-        self.spec_380nm = float(spec_380nm)
-        self.spec_390nm = float(spec_390nm)
-        self.spec_400nm = float(spec_400nm)
-        self.spec_410nm = float(spec_410nm)
-        self.spec_420nm = float(spec_420nm)
-        self.spec_430nm = float(spec_430nm)
-        self.spec_440nm = float(spec_440nm)
-        self.spec_450nm = float(spec_450nm)
-        self.spec_460nm = float(spec_460nm)
-        self.spec_470nm = float(spec_470nm)
-        self.spec_480nm = float(spec_480nm)
-        self.spec_490nm = float(spec_490nm)
-        # end Blue wavelengths
-        # start Green wavelengths
-        self.spec_500nm = float(spec_500nm)
-        self.spec_510nm = float(spec_510nm)
-        self.spec_520nm = float(spec_520nm)
-        self.spec_530nm = float(spec_530nm)
-        self.spec_540nm = float(spec_540nm)
-        self.spec_550nm = float(spec_550nm)
-        self.spec_560nm = float(spec_560nm)
-        self.spec_570nm = float(spec_570nm)
-        self.spec_580nm = float(spec_580nm)
-        self.spec_590nm = float(spec_590nm)
-        self.spec_600nm = float(spec_600nm)
-        self.spec_610nm = float(spec_610nm)
-        # end Green wavelengths
-        # start Red wavelengths
-        self.spec_620nm = float(spec_620nm)
-        self.spec_630nm = float(spec_630nm)
-        self.spec_640nm = float(spec_640nm)
-        self.spec_650nm = float(spec_650nm)
-        self.spec_660nm = float(spec_660nm)
-        self.spec_670nm = float(spec_670nm)
-        self.spec_680nm = float(spec_680nm)
-        self.spec_690nm = float(spec_690nm)
-        self.spec_700nm = float(spec_700nm)
-        self.spec_710nm = float(spec_710nm)
-        self.spec_720nm = float(spec_720nm)
-        # end Red wavelengths
-        self.spec_730nm = float(spec_730nm)
-        self.spec_740nm = float(spec_740nm)
-        self.spec_750nm = float(spec_750nm)
-        self.spec_760nm = float(spec_760nm)
-        self.spec_770nm = float(spec_770nm)
-        self.spec_780nm = float(spec_780nm)
-        self.spec_790nm = float(spec_790nm)
-        self.spec_800nm = float(spec_800nm)
-        self.spec_810nm = float(spec_810nm)
-        self.spec_820nm = float(spec_820nm)
-        self.spec_830nm = float(spec_830nm)
+        # Spectral fields. These are kept in a single NumPy array so that the
+        # spectral math can use them directly. The spec_XXXnm attributes are
+        # properties reading from and writing to this array.
+        self._spec = numpy.array(
+            (
+                float(spec_340nm),
+                float(spec_350nm),
+                float(spec_360nm),
+                float(spec_370nm),
+                # begin Blue wavelengths
+                float(spec_380nm),
+                float(spec_390nm),
+                float(spec_400nm),
+                float(spec_410nm),
+                float(spec_420nm),
+                float(spec_430nm),
+                float(spec_440nm),
+                float(spec_450nm),
+                float(spec_460nm),
+                float(spec_470nm),
+                float(spec_480nm),
+                float(spec_490nm),
+                # end Blue wavelengths
+                # start Green wavelengths
+                float(spec_500nm),
+                float(spec_510nm),
+                float(spec_520nm),
+                float(spec_530nm),
+                float(spec_540nm),
+                float(spec_550nm),
+                float(spec_560nm),
+                float(spec_570nm),
+                float(spec_580nm),
+                float(spec_590nm),
+                float(spec_600nm),
+                float(spec_610nm),
+                # end Green wavelengths
+                # start Red wavelengths
+                float(spec_620nm),
+                float(spec_630nm),
+                float(spec_640nm),
+                float(spec_650nm),
+                float(spec_660nm),
+                float(spec_670nm),
+                float(spec_680nm),
+                float(spec_690nm),
+                float(spec_700nm),
+                float(spec_710nm),
+                float(spec_720nm),
+                # end Red wavelengths
+                float(spec_730nm),
+                float(spec_740nm),
+                float(spec_750nm),
+                float(spec_760nm),
+                float(spec_770nm),
+                float(spec_780nm),
+                float(spec_790nm),
+                float(spec_800nm),
+                float(spec_810nm),
+                float(spec_820nm),
+                float(spec_830nm),
+            ),
+            dtype=numpy.float64,
+        )
 
         #: The color's observer angle. Set with :py:meth:`set_observer`.
         self.observer = None
@@ -330,24 +425,20 @@ class SpectralColor(IlluminantMixin, ColorBase):
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    def __getstate__(self):
+        state = super(SpectralColor, self).__getstate__()
+        # Copies of the color must not share the array with the spectral data.
+        state["_spec"] = self._spec.copy()
+        return state
+
     def get_numpy_array(self):
         """
         Dump this color into NumPy array.
-        """
-        # This holds the obect's spectral data, and will be passed to
-        # numpy.array() to create a numpy array (matrix) for the matrix math
-        # that will be done during the conversion to XYZ.
-        values = []
-
-        # Use the required value list to build this dynamically. Default to
-        # 0.0, since that ultimately won't affect the outcome due to the math
-        # involved.
-        for val in self.VALUES:
-            values.append(getattr(self, val, 0.0))
 
-        # Create and the actual numpy array/matrix from the spectral list.
-        color_array = numpy.array([values])
-        return color_array
+        .. note:: The returned array is a view of the color's spectral data,
+            changing its values changes the color.
+        """
+        return self._spec.reshape(1, -1)
 
     def calc_density(self, density_standard=None):
         """
@@ -362,6 +453,26 @@ class SpectralColor(IlluminantMixin, ColorBase):
             return density.auto_density(self)
 
 
+def _spectral_property(index):
+    """
+    Builds a property exposing a single value of a SpectralColor's spectral
+    data array.
+    """
+
+    def fget(self):
+        return self._spec.item(index)
+
+    def fset(self, value):
+        self._spec[index] = float(value)
+
+    return property(fget, fset)
+
+
+for _index, _name in enumerate(SpectralColor.VALUES):
+    setattr(SpectralColor, _name, _spectral_property(_index))
+del _index, _name
+
+
 class LabColor(IlluminantMixin, ColorBase):
     """
     Represents a CIE Lab color. For more information on CIE Lab,
@@ -370,6 +481,7 @@ class LabColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ["lab_l", "lab_a", "lab_b"]
+    __slots__ = tuple(VALUES) + ("observer", "illuminant")
 
     def __init__(self, lab_l, lab_a, lab_b, observer="2", illuminant="d50"):
         """
@@ -408,6 +520,7 @@ class LCHabColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ["lch_l", "lch_c", "lch_h"]
+    __slots__ = tuple(VALUES) + ("observer", "illuminant")
 
     def __init__(self, lch_l, lch_c, lch_h, observer="2", illuminant="d50"):
         """
@@ -446,6 +559,7 @@ class LCHuvColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ["lch_l", "lch_c", "lch_h"]
+    __slots__ = tuple(VALUES) + ("observer", "illuminant")
 
     def __init__(self, lch_l, lch_c, lch_h, observer="2", illuminant="d50"):
         """
@@ -478,6 +592,7 @@ class LuvColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ["luv_l", "luv_u", "luv_v"]
+    __slots__ = tuple(VALUES) + ("observer", "illuminant")
 
     def __init__(self, luv_l, luv_u, luv_v, observer="2", illuminant="d50"):
         """
@@ -510,6 +625,7 @@ class XYZColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ["xyz_x", "xyz_y", "xyz_z"]
+    __slots__ = tuple(VALUES) + ("observer", "illuminant")
 
     def __init__(self, xyz_x, xyz_y, xyz_z, observer="2", illuminant="d50"):
         """
@@ -540,18 +656,26 @@ class XYZColor(IlluminantMixin, ColorBase):
         This applies an adaptation matrix to change the XYZ color's illuminant.
         You'll most likely only need this during RGB conversions.
         """
-        logger.debug("  \\- Original illuminant: %s", self.illuminant)
-        logger.debug("  \\- Target illuminant: %s", target_illuminant)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("  \\- Original illuminant: %s", self.illuminant)
+            logger.debug("  \\- Target illuminant: %s", target_illuminant)
+
+        # Illuminants are stored in lower case, so only a differently spelled
+        # target needs a second look.
+        if target_illuminant != self.illuminant:
+            target_illuminant = target_illuminant.lower()
 
         # If the XYZ values were taken with a different reference white than the
         # native reference white of the target RGB space, a transformation matrix
         # must be applied.
         if self.illuminant != target_illuminant:
-            logger.debug(
-                "  \\* Applying transformation from %s to %s ",
-                self.illuminant,
-                target_illuminant,
-            )
+            if debug:
+                logger.debug(
+                    "  \\* Applying transformation from %s to %s ",
+                    self.illuminant,
+                    target_illuminant,
+                )
             # Sets the adjusted XYZ values, and the new illuminant.
             apply_chromatic_adaptation_on_color(
                 color=self, targ_illum=target_illuminant, adaptation=adaptation
@@ -565,6 +689,7 @@ class xyYColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ["xyy_x", "xyy_y", "xyy_Y"]
+    __slots__ = tuple(VALUES) + ("observer", "illuminant")
 
     def __init__(self, xyy_x, xyy_y, xyy_Y, observer="2", illuminant="d50"):
         """
@@ -599,6 +724,7 @@ class BaseRGBColor(ColorBase):
     """
 
     VALUES = ["rgb_r", "rgb_g", "rgb_b"]
+    __slots__ = tuple(VALUES) + ("is_upscaled",)
 
     def __init__(self, rgb_r, rgb_g, rgb_b, is_upscaled=False):
         """
@@ -628,10 +754,11 @@ class BaseRGBColor(ColorBase):
         :rtype: float
         :returns: The clamped value.
         """
-        if not self.is_upscaled:
-            return min(max(coord, 0.0), 1.0)
-        else:
-            return min(max(coord, 0.0), 255.0)
+        upper = 255.0 if self.is_upscaled else 1.0
+        # Conditional expressions rather than min()/max(), which are a lot
+        # slower to call. NaN passes through either way.
+        coord = 0.0 if coord < 0.0 else coord
+        return upper if coord > upper else coord
 
     @property
     def clamped_rgb_r(self):
@@ -671,8 +798,15 @@ class BaseRGBColor(ColorBase):
 
         :rtype: str
         """
-        rgb_r, rgb_g, rgb_b = self.get_upscaled_value_tuple()
-        return "#%02x%02x%02x" % (rgb_r, rgb_g, rgb_b)
+        upscaled = self.get_upscaled_value_tuple()
+        try:
+            rgb_bytes = bytearray(upscaled)
+        except ValueError:
+            # Out of gamut values are clamped, each channel has to fit in a byte.
+            rgb_bytes = bytearray(min(max(value, 0), 255) for value in upscaled)
+        # str() keeps this a native string on Python 2, where decode() returns
+        # unicode.
+        return "#" + str(binascii.hexlify(rgb_bytes).decode("ascii"))
 
     @classmethod
     def new_from_rgb_hex(cls, hex_str):
@@ -687,9 +821,11 @@ class BaseRGBColor(ColorBase):
             colorstring = colorstring[1:]
         if len(colorstring) != 6:
             raise ValueError("input #%s is not in #RRGGBB format" % colorstring)
-        r, g, b = colorstring[:2], colorstring[2:4], colorstring[4:]
-        r, g, b = [int(n, 16) / 255.0 for n in (r, g, b)]
-        return cls(r, g, b)
+        try:
+            r, g, b = bytearray(binascii.unhexlify(colorstring))
+        except (TypeError, binascii.Error):
+            raise ValueError("input #%s is not in #RRGGBB format" % colorstring)
+        return cls(r / 255.0, g / 255.0, b / 255.0)
 
 
 # noinspection PyPep8Naming
@@ -708,6 +844,8 @@ class sRGBColor(BaseRGBColor):
         0.0-1.0.
     """
 
+    __slots__ = ()
+
     #: RGB space's gamma constant.
     rgb_gamma = 2.2
     #: The RGB space's native illuminant. Important when converting to XYZ.
@@ -745,6 +883,8 @@ class BT2020Color(BaseRGBColor):
         0.0-1.0.
     """
 
+    __slots__ = ()
+
     #: RGB space's gamma constant.
     rgb_gamma = 2.4
     #: The RGB space's native illuminant. Important when converting to XYZ.
@@ -782,6 +922,8 @@ class AdobeRGBColor(BaseRGBColor):
         0.0-1.0.
     """
 
+    __slots__ = ()
+
     #: RGB space's gamma constant.
     rgb_gamma = 2.2
     #: The RGB space's native illuminant. Important when converting to XYZ.
@@ -819,6 +961,8 @@ class AppleRGBColor(BaseRGBColor):
         0.0-1.0.
     """
 
+    __slots__ = ()
+
     #: RGB space's gamma constant.
     rgb_gamma = 1.8
     #: The RGB space's native illuminant. Important when converting to XYZ.
@@ -847,6 +991,7 @@ class HSLColor(ColorBase):
     """
 
     VALUES = ["hsl_h", "hsl_s", "hsl_l"]
+    __slots__ = tuple(VALUES)
 
     def __init__(self, hsl_h, hsl_s, hsl_l):
         """
@@ -869,6 +1014,7 @@ class HSVColor(ColorBase):
     """
 
     VALUES = ["hsv_h", "hsv_s", "hsv_v"]
+    __slots__ = tuple(VALUES)
 
     def __init__(self, hsv_h, hsv_s, hsv_v):
         """
@@ -891,6 +1037,7 @@ class CMYColor(ColorBase):
     """
 
     VALUES = ["cmy_c", "cmy_m", "cmy_y"]
+    __slots__ = tuple(VALUES)
 
     def __init__(self, cmy_c, cmy_m, cmy_y):
         """
@@ -898,7 +1045,8 @@ class CMYColor(ColorBase):
         :param float cmy_m: M coordinate.
         :param float cmy_y: Y coordinate.
         """
-        super(CMYColor, self).__init__()
+        # Cheaper than calling ColorBase.__init__().
+        self._through_rgb_type = None
         #: C coordinate
         self.cmy_c = float(cmy_c)
         #: M coordinate
@@ -913,6 +1061,7 @@ class CMYKColor(ColorBase):
     """
 
     VALUES = ["cmyk_c", "cmyk_m", "cmyk_y", "cmyk_k"]
+    __slots__ = tuple(VALUES)
 
     def __init__(self, cmyk_c, cmyk_m, cmyk_y, cmyk_k):
         """
@@ -921,7 +1070,8 @@ class CMYKColor(ColorBase):
         :param float cmyk_y: Y coordinate.
         :param float cmyk_k: K coordinate.
         """
-        super(CMYKColor, self).__init__()
+        # Cheaper than calling ColorBase.__init__().
+        self._through_rgb_type = None
         #: C coordinate
         self.cmyk_c = float(cmyk_c)
         #: M coordinate
@@ -942,6 +1092,7 @@ class IPTColor(ColorBase):
     """
 
     VALUES = ["ipt_i", "ipt_p", "ipt_t"]
+    __slots__ = tuple(VALUES)
 
     conversion_matrices = {
         "xyz_to_lms": numpy.array(
@@ -5,6 +5,8 @@ Tests for color difference (Delta E) equations.
 
 import unittest
 
+from colormath import chromatic_adaptation
+from colormath.chromatic_adaptation import apply_chromatic_adaptation
 from colormath.color_objects import XYZColor
 
 
@@ -29,3 +31,21 @@ class chromaticAdaptationTestCase(unittest.TestCase):
             "d65",
             "C to D65 adaptation failed: Illuminant transfer",
         )
+
+    def test_adaptation_to_same_illuminant(self):
+        self.color.apply_adaptation(target_illuminant="c")
+        self.assertEqual(self.color.get_value_tuple(), (0.5, 0.4, 0.1))
+        self.color.apply_adaptation(target_illuminant="C")
+        self.assertEqual(self.color.get_value_tuple(), (0.5, 0.4, 0.1))
+        self.assertEqual(self.color.illuminant, "c")
+
+    def test_measured_white_points_are_not_cached(self):
+        cache = chromatic_adaptation._ADAPTATION_MATRIX_CACHE
+        apply_chromatic_adaptation(0.5, 0.4, 0.1, "c", "d50")
+        size = len(cache)
+        for i in range(10):
+            apply_chromatic_adaptation(
+                0.5, 0.4, 0.1, (0.95 + i * 1e-5, 1.0, 1.08), "d50"
+            )
+        self.assertEqual(len(cache), size)
+        self.assertIn(("c", "d50", "2", "bradford"), cache)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for color arrays and their conversions.
+"""
+
+import unittest
+
+import numpy
+
+from colormath.color_arrays import (
+    LabColorArray,
+    XYZColorArray,
+    RGBColorArray,
+    CMYColorArray,
+    CMYKColorArray,
+    convert_color_array,
+)
+from colormath.color_conversions import convert_color
+from colormath.color_exceptions import UndefinedConversionError
+from colormath.color_objects import (
+    LabColor,
+    XYZColor,
+    sRGBColor,
+    AdobeRGBColor,
+    BT2020Color,
+    HSLColor,
+    CMYColor,
+    CMYKColor,
+)
+
+
+class ColorArrayConversionTestCase(unittest.TestCase):
+    """
+    Conversions of color arrays must match converting every color on its own.
+    """
+
+    def setUp(self):
+        self.lab_data = numpy.array(
+            [
+                (1.807, -3.749, -2.547),
+                (50.0, 0.0, 0.0),
+                (61.2, -3.4, 40.1),
+                (92.0, 54.0, -60.0),
+                (0.0, 0.0, 0.0),
+            ]
+        )
+        self.rgb_data = numpy.array(
+            [
+                (0.482, 0.784, 0.196),
+                (0.0, 0.0, 0.0),
+                (1.0, 1.0, 1.0),
+                (0.01, 0.5, 0.9),
+            ]
+        )
+
+    def assertArrayMatchesColors(self, color_array, colors):
+        self.assertEqual(len(color_array), len(colors))
+        for row, color in zip(color_array.data, colors):
+            numpy.testing.assert_allclose(
+                row, color.get_value_tuple(), rtol=1e-10, atol=1e-10
+            )
+
+    def test_lab_to_xyz(self):
+        lab_array = LabColorArray(self.lab_data, illuminant="d65")
+        xyz_array = convert_color_array(lab_array, XYZColor)
+        self.assertIsInstance(xyz_array, XYZColorArray)
+        self.assertEqual(xyz_array.illuminant, "d65")
+        expected = [
+            convert_color(LabColor(*lab, illuminant="d65"), XYZColor)
+            for lab in self.lab_data
+        ]
+        self.assertArrayMatchesColors(xyz_array, expected)
+
+    def test_xyz_to_lab(self):
+        xyz_data = convert_color_array(LabColorArray(self.lab_data), XYZColor).data
+        lab_array = convert_color_array(XYZColorArray(xyz_data), LabColor)
+        self.assertIsInstance(lab_array, LabColorArray)
+        expected = [convert_color(XYZColor(*xyz), LabColor) for xyz in xyz_data]
+        self.assertArrayMatchesColors(lab_array, expected)
+
+    def test_lab_to_rgb(self):
+        for rgb_type in (sRGBColor, AdobeRGBColor, BT2020Color):
+            rgb_array = convert_color_array(LabColorArray(self.lab_data), rgb_type)
+            self.assertIsInstance(rgb_array, RGBColorArray)
+            self.assertEqual(rgb_array.rgb_type, rgb_type)
+            expected = [
+                convert_color(LabColor(*lab), rgb_type) for lab in self.lab_data
+            ]
+            self.assertArrayMatchesColors(rgb_array, expected)
+
+    def test_rgb_to_lab(self):
+        for rgb_type in (sRGBColor, AdobeRGBColor, BT2020Color):
+            for target_illuminant in (None, "d50", "D65"):
+                lab_array = convert_color_array(
+                    RGBColorArray(self.rgb_data, rgb_type=rgb_type),
+                    LabColor,
+                    target_illuminant=target_illuminant,
+                )
+                expected = [
+                    convert_color(
+                        rgb_type(*rgb), LabColor, target_illuminant=target_illuminant
+                    )
+                    for rgb in self.rgb_data
+                ]
+                self.assertArrayMatchesColors(lab_array, expected)
+                self.assertEqual(lab_array.illuminant, expected[0].illuminant)
+
+    def test_cmyk_round_trip(self):
+        cmy_data = numpy.array(
+            [(0.2, 0.5, 0.7), (1.0, 1.0, 1.0), (0.0, 0.0, 0.0), (0.3, 0.3, 0.9)]
+        )
+        cmyk_array = convert_color_array(CMYColorArray(cmy_data), CMYKColor)
+        self.assertIsInstance(cmyk_array, CMYKColorArray)
+        expected = [convert_color(CMYColor(*cmy), CMYKColor) for cmy in cmy_data]
+        self.assertArrayMatchesColors(cmyk_array, expected)
+
+        cmy_array = convert_color_array(cmyk_array, CMYColor)
+        expected = [convert_color(cmyk, CMYColor) for cmyk in expected]
+        self.assertArrayMatchesColors(cmy_array, expected)
+
+    def test_lab_to_cmyk(self):
+        cmyk_array = convert_color_array(LabColorArray(self.lab_data), CMYKColor)
+        expected = [convert_color(LabColor(*lab), CMYKColor) for lab in self.lab_data]
+        self.assertArrayMatchesColors(cmyk_array, expected)
+
+    def test_cmy_to_lab(self):
+        cmy_array = CMYColorArray(self.rgb_data)
+        lab_array = convert_color_array(
+            cmy_array, LabColor, through_rgb_type=AdobeRGBColor
+        )
+        expected = [
+            convert_color(CMYColor(*cmy), LabColor, through_rgb_type=AdobeRGBColor)
+            for cmy in self.rgb_data
+        ]
+        self.assertArrayMatchesColors(lab_array, expected)
+
+    def test_apply_adaptation(self):
+        xyz_data = convert_color_array(LabColorArray(self.lab_data), XYZColor).data
+        xyz_array = XYZColorArray(xyz_data, illuminant="c")
+        xyz_array.apply_adaptation("D65")
+        self.assertEqual(xyz_array.illuminant, "d65")
+        expected = []
+        for xyz in xyz_data:
+            color = XYZColor(*xyz, illuminant="c")
+            color.apply_adaptation("D65")
+            expected.append(color)
+        self.assertArrayMatchesColors(xyz_array, expected)
+
+    def test_convert_to_self(self):
+        lab_array = LabColorArray(self.lab_data)
+        self.assertIs(convert_color_array(lab_array, LabColor), lab_array)
+
+    def test_undefined_conversion(self):
+        self.assertRaises(
+            UndefinedConversionError,
+            convert_color_array,
+            LabColorArray(self.lab_data),
+            HSLColor,
+        )
+
+    def test_invalid_shape(self):
+        self.assertRaises(ValueError, LabColorArray, numpy.zeros((3, 4)))
+        self.assertRaises(ValueError, LabColorArray, numpy.zeros(3))
+        self.assertRaises(ValueError, CMYKColorArray, numpy.zeros((3, 3)))
+        self.assertEqual(len(CMYKColorArray(numpy.zeros((3, 4)))), 3)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import itertools
+import logging
 import numpy as np
 import unittest
 from colormath import color_conversions
@@ -15,6 +16,9 @@ from colormath.color_objects import (
     BaseRGBColor,
     HSVColor,
     HSLColor,
+    CMYColor,
+    CMYKColor,
+    LuvColor,
     AdobeRGBColor,
     BT2020Color,
     sRGBColor,
@@ -43,6 +47,58 @@ class GraphConversionManagerTestCase(unittest.TestCase):
             HSLColor,
         )
 
+    def test_path_cache_invalidation(self):
+        path = self.manager.get_conversion_path(XYZColor, HSVColor)
+        # Mutating a returned path must not leak into later lookups.
+        path.append(None)
+        self.assertEqual(
+            self.manager.get_conversion_path(XYZColor, HSVColor),
+            [XYZ_to_RGB, HSV_to_RGB],
+        )
+        # Registering a shortcut has to be picked up by cached lookups.
+        self.manager.add_type_conversion(XYZColor, HSVColor, RGB_to_XYZ)
+        self.assertEqual(
+            self.manager.get_conversion_path(XYZColor, HSVColor), [RGB_to_XYZ]
+        )
+
+    def test_conversion_function(self):
+        manager = GraphConversionManager()
+        manager.add_type_conversion(
+            XYZColor, BaseRGBColor, lambda steps, **kwargs: steps + ["xyz->rgb"]
+        )
+        manager.add_type_conversion(
+            BaseRGBColor, HSVColor, lambda steps, **kwargs: steps + ["rgb->hsv"]
+        )
+        convert = manager.get_conversion_function(XYZColor, HSVColor)
+        self.assertEqual(convert([], sRGBColor, None), ["xyz->rgb", "rgb->hsv"])
+        self.assertIs(manager.get_conversion_function(XYZColor, HSVColor), convert)
+
+        # Pairs with the same conversion path share a single function.
+        self.assertIs(
+            manager.get_conversion_function(XYZColor, sRGBColor),
+            manager.get_conversion_function(XYZColor, AdobeRGBColor),
+        )
+
+        # Extra arguments are passed on to every step.
+        manager.add_type_conversion(
+            HSVColor, HSLColor, lambda steps, **kwargs: steps + [kwargs]
+        )
+        convert = manager.get_conversion_function(HSVColor, HSLColor)
+        self.assertEqual(
+            convert([], sRGBColor, "d65", extra=True),
+            [{"target_rgb": sRGBColor, "target_illuminant": "d65", "extra": True}],
+        )
+
+        # There is nothing to do when converting to the same color space.
+        self.assertIsNone(manager.get_conversion_function(XYZColor, XYZColor))
+
+        # Registering a shortcut has to be picked up by cached lookups.
+        manager.add_type_conversion(
+            XYZColor, HSVColor, lambda steps, **kwargs: steps + ["xyz->hsv"]
+        )
+        convert = manager.get_conversion_function(XYZColor, HSVColor)
+        self.assertEqual(convert([], sRGBColor, None), ["xyz->hsv"])
+
 
 class ColorConversionTestCase(unittest.TestCase):
     def test_conversion_validity(self):
@@ -71,6 +127,66 @@ class ColorConversionTestCase(unittest.TestCase):
                 for a, b in zip(path[:-1], path[1:]):
                     self.assertEqual(a.target_type, b.start_type)
 
+    def test_cmy_to_luv_path(self):
+        """
+        CMY(K) to Luv has to end in XYZ_to_Luv.
+        """
+        conversion_manager = color_conversions._conversion_manager
+        for start_space in (CMYColor, CMYKColor):
+            path = conversion_manager.get_conversion_path(start_space, LuvColor)
+            self.assertIs(path[-1], color_conversions.XYZ_to_Luv)
+            self.assertNotIn(XYZ_to_RGB, path)
+            color = start_space(*[0.2] * len(start_space.VALUES))
+            luv = color_conversions.convert_color(color, LuvColor)
+            self.assertIsInstance(luv, LuvColor)
+
+    def test_cmyk_rgb_shortcut(self):
+        """
+        CMYK and RGB convert into each other directly, without the detour
+        through CMY.
+        """
+        conversion_manager = color_conversions._conversion_manager
+        self.assertEqual(
+            conversion_manager.get_conversion_path(CMYKColor, sRGBColor),
+            [color_conversions.CMYK_to_RGB],
+        )
+        self.assertEqual(
+            conversion_manager.get_conversion_path(sRGBColor, CMYKColor),
+            [color_conversions.RGB_to_CMYK],
+        )
+        for cmyk in ((0.1, 0.2, 0.3, 0.4), (0.0, 0.0, 0.0, 1.0), (0.5, 0.0, 1.0, 0.0)):
+            color = CMYKColor(*cmyk)
+            via_cmy = color_conversions.CMY_to_RGB(
+                color_conversions.CMYK_to_CMY(color), sRGBColor
+            )
+            np.testing.assert_allclose(
+                color_conversions.convert_color(color, sRGBColor).get_value_tuple(),
+                via_cmy.get_value_tuple(),
+            )
+            rgb = via_cmy
+            np.testing.assert_allclose(
+                color_conversions.convert_color(rgb, CMYKColor).get_value_tuple(),
+                color_conversions.CMY_to_CMYK(
+                    color_conversions.RGB_to_CMY(rgb)
+                ).get_value_tuple(),
+            )
+
+    def test_debug_logging_conversion(self):
+        """
+        With debug logging enabled, conversions are run step by step. Make
+        sure this gives the same result.
+        """
+        color = XYZColor(0.1, 0.2, 0.3)
+        expected = color_conversions.convert_color(color, HSLColor)
+        logger = color_conversions.logger
+        level = logger.level
+        logger.setLevel(logging.DEBUG)
+        try:
+            result = color_conversions.convert_color(color, HSLColor)
+        finally:
+            logger.setLevel(level)
+        self.assertEqual(result.get_value_tuple(), expected.get_value_tuple())
+
     def test_transfer_functions(self):
         """
         Tests the transfer functions of the various RGB colorspaces.
@@ -5,6 +5,9 @@ Tests for color difference (Delta E) equations.
 
 import unittest
 
+import numpy
+
+from colormath import color_diff_matrix
 from colormath.color_diff import (
     delta_e_cie1976,
     delta_e_cie1994,
@@ -288,3 +291,69 @@ class DeltaETestCase(unittest.TestCase):
     def test_non_lab_color(self):
         other_color = sRGBColor(1.0, 0.5, 0.3)
         self.assertRaises(ValueError, delta_e_cie2000, self.color1, other_color)
+
+
+class DeltaEMatrixTestCase(unittest.TestCase):
+    def setUp(self):
+        self.lab_matrix_1 = numpy.array(
+            [(0.9, 16.3, -2.22), (50.0, 0.0, 0.0), (61.2, -3.4, 40.1)]
+        )
+        self.lab_matrix_2 = numpy.array(
+            [(0.7, 14.2, -1.80), (50.0, -1.0, 2.0), (73.1, 22.5, -9.0), (5.0, 5.0, 5.0)]
+        )
+
+    def test_cie2000_pairwise(self):
+        result = color_diff_matrix.delta_e_cie2000_pairwise(
+            self.lab_matrix_1, self.lab_matrix_2
+        )
+        self.assertEqual(result.shape, (3, 4))
+        for row, lab_color_vector in enumerate(self.lab_matrix_1):
+            expected = color_diff_matrix.delta_e_cie2000(
+                lab_color_vector, self.lab_matrix_2
+            )
+            numpy.testing.assert_allclose(result[row], expected)
+
+    def test_cie2000_sequence_input(self):
+        lab_color_matrix = [tuple(lab) for lab in self.lab_matrix_2]
+        result = color_diff_matrix.delta_e_cie2000((50.0, 1.0, 2.0), lab_color_matrix)
+        expected = color_diff_matrix.delta_e_cie2000(
+            numpy.array((50.0, 1.0, 2.0)), self.lab_matrix_2
+        )
+        numpy.testing.assert_allclose(result, expected)
+        result = color_diff_matrix.delta_e_cie2000(
+            [50.0, 1.0, 2.0], lab_color_matrix, top_k=2
+        )
+        numpy.testing.assert_array_equal(
+            numpy.argsort(result)[:2], numpy.argsort(expected)[:2]
+        )
+        result = color_diff_matrix.delta_e_cie2000_pairwise(
+            [(50.0, 1.0, 2.0)], lab_color_matrix
+        )
+        numpy.testing.assert_allclose(result[0], expected)
+
+    def test_cie2000_top_k(self):
+        lab_color_vector = numpy.array((50.0, 2.0, -3.0))
+        lab_color_matrix = numpy.random.RandomState(0).uniform(
+            (0, -100, -100), (100, 100, 100), (200, 3)
+        )
+        expected = color_diff_matrix.delta_e_cie2000(lab_color_vector, lab_color_matrix)
+        result = color_diff_matrix.delta_e_cie2000(
+            lab_color_vector, lab_color_matrix, top_k=5
+        )
+        closest = numpy.argsort(expected)[:5]
+        numpy.testing.assert_array_equal(numpy.argsort(result)[:5], closest)
+        # Everything that was calculated has to be exact.
+        calculated = numpy.isfinite(result)
+        self.assertLess(calculated.sum(), len(lab_color_matrix))
+        numpy.testing.assert_allclose(result[calculated], expected[calculated])
+
+    def test_cie2000_matches_color_objects(self):
+        for lab_color_vector in self.lab_matrix_1:
+            expected = color_diff_matrix.delta_e_cie2000(
+                lab_color_vector, self.lab_matrix_2
+            )
+            result = [
+                delta_e_cie2000(LabColor(*lab_color_vector), LabColor(*lab))
+                for lab in self.lab_matrix_2
+            ]
+            numpy.testing.assert_allclose(result, expected)
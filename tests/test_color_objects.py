@@ -3,10 +3,14 @@
 Various tests for color objects.
 """
 
+import copy
+import pickle
 import unittest
 
+from colormath import spectral_constants
 from colormath.color_conversions import convert_color
 from colormath.color_objects import (
+    ColorBase,
     SpectralColor,
     XYZColor,
     xyYColor,
@@ -53,6 +57,80 @@ class BaseColorConversionTest(unittest.TestCase):
             )
 
 
+class ColorPickleTestCase(unittest.TestCase):
+    def test_pickle_round_trip(self):
+        hsl = convert_color(
+            sRGBColor(0.1, 0.2, 0.3), HSLColor, through_rgb_type=AdobeRGBColor
+        )
+        colors = [
+            LabColor(1.0, 2.0, 3.0, illuminant="d65", observer="10"),
+            XYZColor(0.1, 0.2, 0.3),
+            sRGBColor(10, 20, 30, is_upscaled=True),
+            CMYKColor(0.1, 0.2, 0.3, 0.4),
+            hsl,
+            SpectralColor(spec_530nm=0.5, illuminant="a"),
+        ]
+        for color in colors:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                unpickled = pickle.loads(pickle.dumps(color, protocol))
+                self.assertIs(unpickled.__class__, color.__class__)
+                self.assertEqual(unpickled.get_value_tuple(), color.get_value_tuple())
+                self.assertEqual(unpickled._through_rgb_type, color._through_rgb_type)
+
+        rgb = pickle.loads(pickle.dumps(colors[2], 0))
+        self.assertTrue(rgb.is_upscaled)
+        spectral = pickle.loads(pickle.dumps(colors[-1], 0))
+        self.assertEqual(spectral.illuminant, "a")
+        self.assertEqual(spectral.spec_530nm, 0.5)
+
+    def test_copy_is_independent(self):
+        for copy_func in (copy.copy, copy.deepcopy):
+            color = SpectralColor(spec_500nm=0.3)
+            color_copy = copy_func(color)
+            color_copy.spec_500nm = 0.9
+            self.assertEqual(color.spec_500nm, 0.3)
+            self.assertEqual(color_copy.spec_500nm, 0.9)
+
+            lab = LabColor(1.0, 2.0, 3.0)
+            lab_copy = copy_func(lab)
+            lab_copy.lab_l = 50.0
+            self.assertEqual(lab.lab_l, 1.0)
+            self.assertEqual(lab_copy.get_value_tuple(), (50.0, 2.0, 3.0))
+
+
+class ColorStringTestCase(unittest.TestCase):
+    def test_str(self):
+        self.assertEqual(
+            str(LabColor(0.9, 16.3, -2.22)),
+            "LabColor (lab_l:0.9000 lab_a:16.3000 lab_b:-2.2200 "
+            "observer:2 illuminant:d50)",
+        )
+        self.assertEqual(
+            str(sRGBColor(0.1, 0.2, 0.3)),
+            "sRGBColor (rgb_r:0.1000 rgb_g:0.2000 rgb_b:0.3000)",
+        )
+
+    def test_str_with_missing_value(self):
+        color = HSLColor(0.1, 0.2, 0.3)
+        color.hsl_s = None
+        self.assertEqual(str(color), "HSLColor (hsl_h:0.1000 hsl_l:0.3000)")
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(LabColor(0.9, 16.3, -2.22)),
+            "LabColor(lab_l=0.9, lab_a=16.3, lab_b=-2.22, "
+            "observer='2', illuminant='d50')",
+        )
+        self.assertEqual(
+            repr(sRGBColor(0.1, 0.2, 0.3)),
+            "sRGBColor(rgb_r=0.1, rgb_g=0.2, rgb_b=0.3)",
+        )
+
+    def test_without_values(self):
+        self.assertEqual(str(ColorBase()), "ColorBase ()")
+        self.assertEqual(repr(ColorBase()), "ColorBase()")
+
+
 class SpectralConversionTestCase(BaseColorConversionTest):
     def setUp(self):
         """
@@ -105,6 +183,14 @@ class SpectralConversionTestCase(BaseColorConversionTest):
         xyz = convert_color(self.color, XYZColor)
         self.assertColorMatch(xyz, XYZColor(0.115, 0.099, 0.047))
 
+    def test_conversion_to_xyz_with_illuminant_override(self):
+        xyz = convert_color(
+            self.color,
+            XYZColor,
+            illuminant_override=spectral_constants.REF_ILLUM_TABLE["d50"],
+        )
+        self.assertColorMatch(xyz, XYZColor(0.115, 0.099, 0.047))
+
     def test_conversion_to_xyz_with_negatives(self):
         """
         This has negative spectral values, which should never happen. Just
@@ -119,6 +205,14 @@ class SpectralConversionTestCase(BaseColorConversionTest):
         same_color = convert_color(self.color, SpectralColor)
         self.assertEqual(self.color, same_color)
 
+    def test_numpy_array_matches_attributes(self):
+        self.color.spec_530nm = 0.5
+        spectral_array = self.color.get_numpy_array()
+        self.assertEqual(spectral_array.shape, (1, len(SpectralColor.VALUES)))
+        for index, attrib in enumerate(SpectralColor.VALUES):
+            self.assertEqual(spectral_array[0, index], getattr(self.color, attrib))
+        self.assertIsInstance(self.color.spec_530nm, float)
+
 
 class XYZConversionTestCase(BaseColorConversionTest):
     def setUp(self):
@@ -399,11 +493,27 @@ class RGBConversionTestCase(BaseColorConversionTest):
     def test_get_rgb_hex(self):
         hex_str = self.color.get_rgb_hex()
         self.assertEqual(hex_str, "#7bc832", "sRGB to hex conversion failed")
+        self.assertIs(type(hex_str), str)
+
+    def test_get_rgb_hex_out_of_gamut(self):
+        hex_str = sRGBColor(1.2, 0.784, -0.1).get_rgb_hex()
+        self.assertEqual(hex_str, "#ffc800")
 
     def test_set_from_rgb_hex(self):
         rgb = sRGBColor.new_from_rgb_hex("#7bc832")
         self.assertColorMatch(rgb, sRGBColor(0.482, 0.784, 0.196))
 
+    def test_set_from_uppercase_rgb_hex(self):
+        rgb = sRGBColor.new_from_rgb_hex("7BC832")
+        self.assertColorMatch(rgb, sRGBColor(0.482, 0.784, 0.196))
+
+    def test_set_from_invalid_rgb_hex(self):
+        self.assertRaises(ValueError, sRGBColor.new_from_rgb_hex, "#7bc8zz")
+        self.assertRaises(ValueError, sRGBColor.new_from_rgb_hex, "#7bc83")
+        # Strings int(..., 16) would accept, but aren't hex colors.
+        self.assertRaises(ValueError, sRGBColor.new_from_rgb_hex, "#0x7bc8")
+        self.assertRaises(ValueError, sRGBColor.new_from_rgb_hex, "#+7bc83")
+
 
 class HSLConversionTestCase(BaseColorConversionTest):
     def setUp(self):
@@ -442,6 +552,15 @@ class CMYConversionTestCase(BaseColorConversionTest):
         cmyk = convert_color(self.color, CMYKColor)
         self.assertColorMatch(cmyk, CMYKColor(0.385, 0.000, 0.750, 0.216))
 
+    def test_through_rgb_type(self):
+        self.assertIsNone(self.color._through_rgb_type)
+        cmy = convert_color(
+            convert_color(self.color, LabColor, through_rgb_type=AdobeRGBColor),
+            CMYColor,
+        )
+        self.assertIsNone(cmy._through_rgb_type)
+        self.assertColorMatch(cmy, self.color)
+
     def test_conversion_to_rgb(self):
         rgb = convert_color(self.color, sRGBColor)
         self.assertColorMatch(rgb, sRGBColor(0.482, 0.784, 0.196))
@@ -462,6 +581,8 @@ class CMYKConversionTestCase(BaseColorConversionTest):
     def test_convert_to_self(self):
         same_color = convert_color(self.color, CMYKColor)
         self.assertEqual(self.color, same_color)
+        # Converting to the same color space returns the color as it is.
+        self.assertIs(same_color, self.color)
 
 
 class IPTConversionTestCase(BaseColorConversionTest):